@@ -1,10 +1,14 @@
 """Python versions of the objects represented by the 2DM mesh."""
 
 import abc
+import array
 import functools
+import math
+import operator
+import sys
 import warnings
-from typing import (Any, ClassVar, Iterable, List, Optional, SupportsFloat,
-                    Tuple, Type, TypeVar, Union)
+from typing import (Any, ClassVar, Dict, Iterable, List, Optional,
+                    SupportsFloat, Tuple, Type, TypeVar, Union)
 
 from .errors import CardError, CustomFormatIgnored
 from ._parser import parse_element, parse_node, parse_node_string
@@ -192,7 +196,7 @@ class Node(Entity):
         :rtype: :class:`Node`
         """
         id_, *pos = parse_node(line, **kwargs)
-        if len(line.split()) > 5 and len(line.split('#')[0].split()) > 5:
+        if _node_has_extra_fields(line):
             warnings.warn('unexpected node fields', CustomFormatIgnored)
         return cls(id_, *pos)
 
@@ -229,7 +233,7 @@ class Element(Entity):
     """
     # pylint: disable=invalid-name
 
-    __slots__ = ['id', 'materials', 'nodes']
+    __slots__ = ['_nodes', 'id', 'materials']
     card: ClassVar[str]
     num_nodes: ClassVar[int]
     """The number of nodes of this element."""
@@ -250,18 +254,22 @@ class Element(Entity):
         :param materials: Any number of material IDs for the element,
            defaults to :obj:`None`
         :type materials: :class:`tuple` [:class:`int` | :class:`float`], optional
+        :raises TypeError: Raised if any of the node IDs is not an
+            integer.
         """
-        if hasattr(self, 'num_nodes') and len(nodes) != self.num_nodes:
-            raise CardError(f'{self.card} element requires {self.num_nodes} '
+        num_nodes = getattr(self, 'num_nodes', len(nodes))
+        if len(nodes) != num_nodes:
+            raise CardError(f'{self.card} element requires {num_nodes} '
                             f'nodes, got {len(nodes)}')
-        if any((n < 0 for n in nodes)):
+        if nodes and min(nodes) < 0:
             raise ValueError(f'Negative ID in node list: {nodes}')
         self.id: int = id_
         """The unique ID of the element.
 
         :type: :class:`int`
         """
-        self.materials: Tuple[Union[int, float], ...] = materials or ()
+        self.materials: Tuple[Union[int, float], ...] = (
+            _intern_materials(materials) if materials else ())
         """Material IDs assigned to this element.
 
         Depending on the 2DM-like format used, this could be a floating
@@ -269,11 +277,7 @@ class Element(Entity):
 
         :type: :class:`tuple` [:class:`int` | :class:`float`, ...]
         """
-        self.nodes: Tuple[int, ...] = tuple(nodes)
-        """The defining nodes for this element.
-
-        :type: :class:`tuple` [:class:`int`, ...]
-        """
+        self._nodes = _node_array(nodes, type(self).__name__)
 
     def __eq__(self, other: Any) -> bool:
         """Custom instance equality check.
@@ -284,7 +288,7 @@ class Element(Entity):
         if not super().__eq__(other):
             return False
         return (self.id == other.id and
-                self.nodes == other.nodes and
+                self._nodes == other._nodes and
                 self.materials == other.materials)
 
     def __repr__(self) -> str:
@@ -300,6 +304,24 @@ class Element(Entity):
         """
         return len(self.materials)
 
+    @property
+    def nodes(self) -> Tuple[int, ...]:
+        """The defining nodes for this element.
+
+        Node IDs are stored in a compact :class:`array.array`; a new
+        tuple is created on every access.
+
+        Assigned node IDs must be integers, other values raise a
+        :class:`TypeError`.
+
+        :type: :class:`tuple` [:class:`int`, ...]
+        """
+        return tuple(self._nodes)
+
+    @nodes.setter
+    def nodes(self, value: Iterable[int]) -> None:
+        self._nodes = _node_array(tuple(value), type(self).__name__)
+
     @classmethod
     def from_line(cls: Type[_ElementT], line: str, **kwargs: Any) -> _ElementT:
         """Create a new instance from the given line.
@@ -313,7 +335,8 @@ class Element(Entity):
         :param allow_zero_index: Whether to allow a node ID of zero.
         :type allow_zero_index: :class:`bool`, optional
         """
-        if not line.startswith(cls.card):
+        # All element cards are three characters long
+        if line[:3] != cls.card:
             raise CardError('Bad card', line.split(maxsplit=1)[0])
         flag = kwargs.pop('allow_float_matid', True)
         id_, nodes, materials = parse_element(
@@ -338,7 +361,7 @@ class Element(Entity):
             raise ValueError('Invalid element with negative ID encountered')
         id_width = int(kwargs.get('id_width', 8))
         out = [self.card, f'{self.id:{id_width}}']
-        out.extend((f'{n:{id_width}}' for n in self.nodes))
+        out.extend((f'{n:{id_width}}' for n in self._nodes))
         # Discard floating point material indices if disallowed
         matids: Iterable[_Material] = self.materials
         if not kwargs.get('allow_float_matid', True):
@@ -368,6 +391,8 @@ class LinearElement(Element):
 
     """
 
+    __slots__: List[str] = []
+
 
 class TriangularElement(Element):
     """Base class for triangular mesh elements.
@@ -385,6 +410,8 @@ class TriangularElement(Element):
 
     """
 
+    __slots__: List[str] = []
+
 
 class QuadrilateralElement(Element):
     """Base class for quadrilateral mesh elements.
@@ -402,6 +429,8 @@ class QuadrilateralElement(Element):
 
     """
 
+    __slots__: List[str] = []
+
 
 class Element2L(LinearElement):
     """Two-noded, linear element (E2L).
@@ -409,6 +438,7 @@ class Element2L(LinearElement):
     **Base classes:** :class:`py2dm.LinearElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E2L'
     num_nodes: ClassVar[int] = 2
 
@@ -419,6 +449,7 @@ class Element3L(LinearElement):
     **Base classes:** :class:`py2dm.LinearElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E3L'
     num_nodes: ClassVar[int] = 3
 
@@ -429,6 +460,7 @@ class Element3T(TriangularElement):
     **Base classes:** :class:`py2dm.TriangularElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E3T'
     num_nodes: ClassVar[int] = 3
 
@@ -439,6 +471,7 @@ class Element6T(TriangularElement):
     **Base classes:** :class:`py2dm.TriangularElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E6T'
     num_nodes: ClassVar[int] = 6
 
@@ -449,6 +482,7 @@ class Element4Q(QuadrilateralElement):
     **Base classes:** :class:`py2dm.QuadrilateralElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E4Q'
     num_nodes: ClassVar[int] = 4
 
@@ -459,6 +493,7 @@ class Element8Q(QuadrilateralElement):
     **Base classes:** :class:`py2dm.QuadrilateralElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E8Q'
     num_nodes: ClassVar[int] = 8
 
@@ -469,6 +504,7 @@ class Element9Q(QuadrilateralElement):
     **Base classes:** :class:`py2dm.QuadrilateralElement`
     """
 
+    __slots__: List[str] = []
     card: ClassVar[str] = 'E9Q'
     num_nodes: ClassVar[int] = 9
 
@@ -490,7 +526,7 @@ class NodeString:
        :func:`issubclass` checks will fail for node strings.
     """
 
-    __slots__ = ['name', 'nodes']
+    __slots__ = ['_nodes', 'name']
     card: ClassVar[str] = 'NS'
 
     def __init__(self, *nodes: int, name: Optional[str] = None) -> None:
@@ -505,7 +541,10 @@ class NodeString:
         :type \*nodes: :class:`int`
         :param name: An optional name to give to a particular node
             string, defaults to :obj:`None`
-        :type name: :class:`str`, optional"""
+        :type name: :class:`str`, optional
+        :raises TypeError: Raised if any of the node IDs is not an
+            integer.
+        """
         if len(nodes) < 2:
             raise CardError('At least two node required')
         self.name: Optional[str] = name
@@ -513,11 +552,7 @@ class NodeString:
 
         :type: :class:`str` | :obj:`None`
         """
-        self.nodes: Tuple[int, ...] = tuple(nodes)
-        """The defining nodes of the node strings.
-
-        :type: :class:`tuple` [:class:`int`]
-        """
+        self._nodes = _node_array(nodes, type(self).__name__)
 
     def __eq__(self, other: Any) -> bool:
         """Custom instance equality check.
@@ -528,7 +563,7 @@ class NodeString:
         # pylint: disable=unidiomatic-typecheck
         if not (type(self) == type(other) and self.card == other.card):
             return False
-        return self.nodes == other.nodes and self.name == other.name
+        return self._nodes == other._nodes and self.name == other.name
 
     def __repr__(self) -> str:
         if self.name is not None:
@@ -541,7 +576,25 @@ class NodeString:
 
         :type: :class:`int`
         """
-        return len(self.nodes)
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> Tuple[int, ...]:
+        """The defining nodes of the node strings.
+
+        Node IDs are stored in a compact :class:`array.array`; a new
+        tuple is created on every access.
+
+        Assigned node IDs must be integers, other values raise a
+        :class:`TypeError`.
+
+        :type: :class:`tuple` [:class:`int`]
+        """
+        return tuple(self._nodes)
+
+    @nodes.setter
+    def nodes(self, value: Iterable[int]) -> None:
+        self._nodes = _node_array(tuple(value), type(self).__name__)
 
     @classmethod
     def from_line(cls, line: str, node_string: Optional['NodeString'] = None,
@@ -561,15 +614,16 @@ class NodeString:
         :return: The created node string and the final flag
         :rtype: :class:`tuple` [:class:`NodeString`, :class:`bool`]
         """
-        nodes: List[int] = (
-            [] if node_string is None else list(node_string.nodes))
-        nodes, is_done, name = parse_node_string(line, nodes=nodes, **kwargs)
+        nodes, is_done, name = parse_node_string(line, nodes=[], **kwargs)
         if node_string is None:
             node_string = NodeString(*nodes)
         else:
-            node_string.nodes = tuple(nodes)
+            # pylint: disable=protected-access
+            node_string._nodes.extend(nodes)
         if name:
-            node_string.name = name.strip('"')
+            # Names are used as lookup keys, interning makes them cheap
+            # to compare and shares repeated names between node strings
+            node_string.name = sys.intern(name.strip('"'))
         return node_string, is_done
 
     def to_line(self, **kwargs: Any) -> List[str]:
@@ -582,23 +636,99 @@ class NodeString:
         :return: A list of words to write to disk
         :rtype: :class:`list` [:class:`str`]
         """
+        nodes = [str(n) for n in self._nodes]
+        # Flip last node ID to signify the end of the node sign
+        nodes[-1] = f'-{nodes[-1]}'
         list_ = [self.card]
         fold = int(kwargs.get('fold_after', 10))
         if fold > 0:
-            for index, node in enumerate(self.nodes):
-                if (index != 0 and index % fold == 0
-                        and len(self.nodes) > index):
-                    list_.extend(('\n', self.card))
-                list_.append(str(node))
+            list_.extend(nodes[:fold])
+            for start in range(fold, len(nodes), fold):
+                list_.extend(('\n', self.card))
+                list_.extend(nodes[start:start+fold])
         else:
-            list_.extend((str(n) for n in self.nodes))
-        # Flip last node ID to signify the end of the node sign
-        list_[-1] = f'-{list_[-1]}'
+            list_.extend(nodes)
         if self.name is not None and kwargs.get('include_name', True):
             list_.append(self.name)
         return list_
 
 
+def _node_has_extra_fields(line: str) -> bool:
+    """Return whether a node definition has fields past its Z value.
+
+    Trailing comments are not counted as extra fields.
+
+    :param line: The node definition to check.
+    :type line: :class:`str`
+    :return: Whether there are more than five fields before any
+        comment.
+    :rtype: :class:`bool`
+    """
+    return len(line.split('#', maxsplit=1)[0].split(maxsplit=5)) > 5
+
+
+def _intern_materials(materials: Tuple[_Material, ...]
+                      ) -> Tuple[_Material, ...]:
+    """Return a shared instance of a small, integer-only materials tuple.
+
+    Most meshes only use a handful of distinct material IDs, so
+    elements can share their materials tuple rather than each holding
+    an identical copy.
+
+    Only tuples of plain integers are interned; ``(1, 2)`` and
+    ``(1.0, 2)`` compare equal but must be kept apart as they are
+    written differently. The cache stops growing once it is full.
+
+    :param materials: The materials tuple to intern.
+    :type materials: :class:`tuple` [:class:`int` | :class:`float`]
+    :return: An equal tuple, possibly shared with other elements.
+    :rtype: :class:`tuple` [:class:`int` | :class:`float`]
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(materials) is not tuple or len(materials) > 4:
+        return materials
+    for matid in materials:
+        if type(matid) is not int:
+            return materials
+    cached = _MATERIALS_CACHE.get(materials)
+    if cached is not None:
+        return cached
+    if len(_MATERIALS_CACHE) < _MATERIALS_CACHE_SIZE:
+        _MATERIALS_CACHE[materials] = materials
+    return materials
+
+
+_MATERIALS_CACHE: Dict[Tuple[_Material, ...], Tuple[_Material, ...]] = {}
+_MATERIALS_CACHE_SIZE = 1024
+
+
+def _node_array(nodes: Tuple[int, ...], entity: str) -> 'array.array[int]':
+    """Store the given node IDs in a compact array.
+
+    :param nodes: The node IDs to store.
+    :type nodes: :class:`tuple` [:class:`int`]
+    :param entity: The name of the entity, used in error messages.
+    :type entity: :class:`str`
+    :raises TypeError: Raised if any of the node IDs is not an integer.
+    :return: An array containing the given node IDs.
+    :rtype: :class:`array.array`
+    """
+    try:
+        return array.array('q', nodes)
+    except TypeError:
+        pass
+    # Retry with any integer-like types converted, reporting the first
+    # value that cannot be used as a node ID
+    ids: List[int] = []
+    for node in nodes:
+        try:
+            ids.append(operator.index(node))
+        except TypeError:
+            raise TypeError(f'{entity} node IDs must be integers, '
+                            f'got {node!r}') from None
+    return array.array('q', ids)
+
+
 def _format_float(value: SupportsFloat, *, decimals: int = 6) -> str:
     """Format a node position into a string.
 
@@ -631,12 +761,39 @@ def _format_matid(value: _Material, *, decimals: int = 6) -> str:
     :return: The formatted material index.
     :rtype: :class:`str`
     """
+    # -0.0 compares and hashes equal to 0.0 but keeps its sign when
+    # formatted, so it must not share a cache entry with 0.0
+    if value == 0 and math.copysign(1, value) < 0:
+        return _format_float(value, decimals=decimals)
+    return _format_matid_cached(value, decimals)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _format_matid_cached(value: _Material, decimals: int) -> str:
+    """Cached implementation of :func:`_format_matid`.
+
+    Meshes typically only use a handful of distinct material IDs, so
+    results are cached. The cache is typed as ``1`` and ``1.0`` hash
+    identically but must be formatted differently.
+
+    :param value: The material index to format.
+    :type value: :class:`int` | :class:`float`
+    :param decimals: The number of decimal places to include for
+        floating point material IDs.
+    :type decimals: :class:`int`
+    :return: The formatted material index.
+    :rtype: :class:`str`
+    """
     if isinstance(value, int):
         return str(value) if value < 0 else f' {value}'
     return _format_float(value, decimals=decimals)
 
 
-@functools.lru_cache(None)
+_CARD_TABLE: Dict[str, Type[Element]] = {
+    cls.card: cls for cls in (Element2L, Element3L, Element3T, Element4Q,
+                              Element6T, Element8Q, Element9Q)}
+
+
 def element_factory(line: str) -> Type[Element]:
     """Return a :class:`py2dm.Element` subclass by card.
 
@@ -647,10 +804,11 @@ def element_factory(line: str) -> Type[Element]:
     :return: The element type matching the given card.
     :rtype: :obj:`type` [:class:`py2dm.Element`]
     """
-    for element_group in Element.__subclasses__():
-        for subclass in element_group.__subclasses__():
-            if line.startswith(subclass.card):
-                return subclass
+    # All element cards are three characters long
+    try:
+        return _CARD_TABLE[line[:3]]
+    except KeyError:
+        pass
     if not line.split() or not line.split('#')[0].split():
         raise ValueError('Line is blank')
     card = line.split(maxsplit=1)[0]
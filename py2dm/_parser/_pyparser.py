@@ -16,7 +16,7 @@ _MetadataArgs = Tuple[
     int,            # node strings start
 ]
 
-_ELEMENT_CARDS = [
+_ELEMENT_CARDS = frozenset((
     'E2L',
     'E3L',
     'E3T',
@@ -24,7 +24,18 @@ _ELEMENT_CARDS = [
     'E6T',
     'E8Q',
     'E9Q',
-]
+))
+
+# Number of nodes for each element card
+_NODES_PER_ELEMENT = {
+    'E2L': 2,
+    'E3L': 3,
+    'E3T': 3,
+    'E4Q': 4,
+    'E6T': 6,
+    'E8Q': 8,
+    'E9Q': 9,
+}
 
 
 def parse_element(line: str, allow_float_matid: bool = True,
@@ -44,11 +55,10 @@ def parse_element(line: str, allow_float_matid: bool = True,
                         f'(id, node_1, node_2), got {len(chunks)-1}')
     # 2DM card
     card = chunks[0]
-    if not _card_is_element(card):
+    num_nodes = _NODES_PER_ELEMENT.get(card, -1)
+    if num_nodes < 0:
         raise CardError(f'Invalid element card "{card}"')
     # Length (card known)
-    num_nodes = _nodes_per_element(card)
-    assert num_nodes > 0
     if len(chunks) < num_nodes + 2:
         raise CardError(
             f'{card} element definition requires at least {num_nodes-1} '
@@ -169,6 +179,9 @@ def scan_metadata(file_: IO[str], filename: Union[str, pathlib.Path],
 
     file_.seek(0)
     for index, line_raw in enumerate(iter(file_.readline, '')):
+        if not mesh2d_found:
+            # Ignore any UTF-8 byte order mark before the MESH2D tag
+            line_raw = line_raw.lstrip('\ufeff')
         # Skip blank lines
         line = line_raw.split('#', maxsplit=1)[0].strip()
         if not line:
@@ -195,8 +208,9 @@ def scan_metadata(file_: IO[str], filename: Union[str, pathlib.Path],
             if nodes_start < 0:
                 nodes_start = file_.tell() - len(line_raw) - 1
             continue
-        if line.split(maxsplit=1)[0] in _ELEMENT_CARDS:
-            id_ = int(line.split(maxsplit=2)[1])
+        chunks = line.split(maxsplit=2)
+        if chunks[0] in _ELEMENT_CARDS:
+            id_ = int(chunks[1])
             if id_ == 0 and not allow_zero_index:
                 raise FormatError(
                     'Zero index encountered in non-zero-indexed file',
@@ -238,23 +252,3 @@ def scan_metadata(file_: IO[str], filename: Union[str, pathlib.Path],
     return (num_nodes, num_elements, num_node_strings, name,
             num_materials_per_elem, nodes_start, elements_start,
             node_strings_start)
-
-
-def _card_is_element(card: str) -> bool:
-    return card in ('E2L', 'E3L', 'E3T', 'E4Q', 'E6T', 'E8Q', 'E9Q')
-
-
-def _nodes_per_element(card: str) -> int:
-    if card == 'E2L':
-        return 2
-    if card in ('E3L', 'E3T'):
-        return 3
-    if card == 'E4Q':
-        return 4
-    if card == 'E6T':
-        return 6
-    if card == 'E8Q':
-        return 8
-    if card == 'E9Q':
-        return 9
-    return -1
@@ -6,14 +6,18 @@ for specific use-cases.
 """
 
 import abc
+import array
+import io
 import pathlib
+import warnings
 from types import TracebackType
-from typing import (Any, Iterator, List, NamedTuple, Optional, Tuple, Type,
-                    TypeVar, Union)
+from typing import (IO, Any, Dict, Iterator, List, NamedTuple, Optional,
+                    Tuple, Type, TypeVar, Union)
 
-from ._entities import Element, Node, NodeString, element_factory
-from .errors import FileIsClosedError
-from ._parser import scan_metadata
+from ._entities import (Element, Node, NodeString, element_factory,
+                        _intern_materials, _node_has_extra_fields)
+from .errors import CustomFormatIgnored, FileIsClosedError
+from ._parser import parse_node, scan_metadata
 from ._typing import Literal, cached_property
 
 __all__ = [
@@ -54,6 +58,12 @@ class ReaderBase(metaclass=abc.ABCMeta):
         :type filepath: :class:`str` | :class:`pathlib.Path`
         :param encoding: Encoding to use when reading the file.
         :type encoding: :class:`str`
+        :param buffered: Whether to read the entire file into memory
+            in a single call rather than streaming it line by line.
+            This can greatly speed up reading from network file
+            systems at the cost of holding the file contents in memory
+            while the mesh is parsed. Defaults to :obj:`True`.
+        :type buffered: :class:`bool`, optional
         """
         self.name: str = 'Unnamed mesh'
         """Display name of the mesh.
@@ -71,6 +81,8 @@ class ReaderBase(metaclass=abc.ABCMeta):
         self._num_materials = int(kwargs.get('materials', 0))
         self._float_materials = bool(kwargs.get('allow_float_matid', True))
         self._zero_index = bool(kwargs.get('zero_index', False))
+        self._buffered = bool(kwargs.get('buffered', True))
+        self._buffer: Optional[bytes] = None
         self._metadata: _Metadata
 
     def __enter__(self: _ReaderT) -> _ReaderT:
@@ -266,6 +278,7 @@ class ReaderBase(metaclass=abc.ABCMeta):
             This method is called automatically when using the class
             via the context manager.
         """
+        self._buffer = None
         self._closed = True
 
     def open(self) -> None:
@@ -279,7 +292,10 @@ class ReaderBase(metaclass=abc.ABCMeta):
         Alternatively, you can use the context manager interface, in
         which case both methods will be called automatically.
         """
-        with open(self._filepath, encoding=self._encoding) as file_:
+        if self._buffered:
+            with open(self._filepath, 'rb') as file_:
+                self._buffer = file_.read()
+        with self._open_file() as file_:
             self._metadata = _Metadata(
                 *scan_metadata(file_, self._filepath, self._zero_index))
         if self._metadata.name is not None:
@@ -325,6 +341,9 @@ class ReaderBase(metaclass=abc.ABCMeta):
                 node_strings = list(mesh.node_strings)
                 node_string_two = node_strings[1]
 
+        If multiple node strings share the same name, the first one
+        defined in the file is returned.
+
         :param name: Unique name of the node string
         :raises KeyError: Raised if no node string of the given name
             exists
@@ -397,6 +416,21 @@ class ReaderBase(metaclass=abc.ABCMeta):
         :type: :class:`py2dm.NodeString`
         """
 
+    def _open_file(self) -> IO[str]:
+        """Return a new text stream over the mesh file.
+
+        For buffered readers, this is a stream over the in-memory copy
+        of the file read in :meth:`open`; otherwise the file is opened
+        from disk.
+
+        :return: A readable, seekable text stream.
+        :rtype: :class:`typing.IO` [:class:`str`]
+        """
+        if self._buffer is not None:
+            return io.TextIOWrapper(
+                io.BytesIO(self._buffer), encoding=self._encoding)
+        return open(self._filepath, encoding=self._encoding)
+
     def _require_open(self) -> None:
         """Check whether the file reader is still open.
 
@@ -420,49 +454,94 @@ class Reader(ReaderBase):
     fast ID-based access and iteration without needing to wait for the
     storage medium.
 
-    Do note that this implementation also keeps the Python
-    representation of all mesh entities in memory until the instance
-    is destroyed, which can consume a significant amount of memory for
-    very large meshes.
+    Do note that this implementation also keeps all mesh entities in
+    memory until the instance is destroyed, which can consume a
+    significant amount of memory for very large meshes. Node IDs and
+    coordinates are stored in compact arrays and only converted into
+    :class:`py2dm.Node` instances when accessed.
+
+    When created with ``lazy=True``, elements are not decoded while
+    opening the mesh. Their lines are kept as-is instead and each
+    element is only parsed the first time it is accessed, which speeds
+    up opening large meshes when only some of their elements are used.
+    Note that this also defers any format errors in element cards
+    until the offending element is accessed. Eager loading skips
+    element lines that fail to parse with a :class:`ValueError`, while
+    lazy loading keeps them and raises when they are accessed instead.
+    For such meshes, the elements returned for a given ID or position
+    may differ between the two modes.
+
+    Passing ``single_precision=True`` stores node coordinates as
+    32-bit floats, halving their memory use. This rounds coordinates
+    to about seven significant digits, which is not enough for most
+    projected coordinate systems, so it is disabled by default.
     """
 
     def __init__(self, filepath: Union[str, pathlib.Path],
                  **kwargs: Any) -> None:
         super().__init__(filepath, **kwargs)
 
-        self._cache_nodes: List[Node] = []
+        self._lazy = bool(kwargs.get('lazy', False))
+        self._node_ids = array.array('q')
+        self._node_coords = array.array(
+            'f' if kwargs.get('single_precision', False) else 'd')
         self._cache_elements: List[Element] = []
+        self._element_lines: List[Tuple[str, Type[Element]]] = []
+        self._lazy_elements: Dict[int, Element] = {}
         self._cache_node_strings: List[NodeString] = []
+        self._node_strings_by_name: Dict[str, NodeString] = {}
 
     def open(self) -> None:
         super().open()
         # Parse and load the entire file
-        with open(self._filepath, encoding=self._encoding) as file_:
+        with self._open_file() as file_:
             # Nodes
             if self.num_nodes > 0:
                 file_.seek(self._metadata.pos_nodes)
+                # Emitting one warning per node is slow for formats
+                # that always add extra fields, so they are counted
+                # here and reported once after the loop
+                num_extra_fields = 0
                 for line in file_:
                     if not line.startswith('ND'):
                         continue
-                    node = Node.from_line(
+                    id_, *pos = parse_node(
                         line, allow_zero_index=self._zero_index)
-                    self._cache_nodes.append(node)
-                    if node.id >= self.num_nodes:
+                    if _node_has_extra_fields(line):
+                        num_extra_fields += 1
+                    self._node_ids.append(id_)
+                    self._node_coords.extend(pos)
+                    if id_ >= self.num_nodes:
                         break
+                if num_extra_fields:
+                    warnings.warn(
+                        f'unexpected node fields ({num_extra_fields} nodes)',
+                        CustomFormatIgnored)
             # Elements
             if self.num_elements > 0:
                 file_.seek(self._metadata.pos_elements)
+                # Elements tend to come in long runs of the same card, so
+                # only look up the element type when the card changes
+                last_card = ''
+                element_type: Type[Element] = Element
                 for line in file_:
+                    card = line[:3]
                     try:
-                        element = element_factory(line).from_line(
-                            line, allow_zero_index=self._zero_index,
-                            allow_float_matid=self._float_materials)
+                        if card != last_card:
+                            # Skip comments and blank lines without
+                            # raising in the element factory
+                            if card[:1] == '#' or line.isspace():
+                                continue
+                            element_type = element_factory(line)
+                            last_card = card
+                        if self._lazy:
+                            self._element_lines.append((line, element_type))
+                            if len(self._element_lines) >= self.num_elements:
+                                break
+                            continue
+                        element = self._decode_element(line, element_type)
                     except ValueError:
                         continue
-                    # Strip extra elements
-                    if len(element.materials) > self._num_materials:
-                        element.materials = tuple(
-                            element.materials[:self._num_materials])
                     self._cache_elements.append(element)
                     if element.id >= self.num_elements - self._zero_index:
                         break
@@ -475,17 +554,37 @@ class Reader(ReaderBase):
                         line, node_string, allow_zero_index=self._zero_index)
                     if is_done:
                         self._cache_node_strings.append(node_string)
+                        # Only the first node string of a given name
+                        # can be looked up by name
+                        if node_string.name is not None:
+                            self._node_strings_by_name.setdefault(
+                                node_string.name, node_string)
                         node_string = None
+        # All entities are cached, the file contents are no longer needed
+        self._buffer = None
+
+    @cached_property
+    def extent(self) -> Tuple[float, float, float, float]:
+        self._require_open()
+        if not self._node_coords:
+            # Mesh is empty/contains no nodes
+            return float('nan'), float('nan'), float('nan'), float('nan')
+        # Coordinates are interleaved, slicing gives the X and Y values
+        pos_x = self._node_coords[0::3]
+        pos_y = self._node_coords[1::3]
+        return min(pos_x), max(pos_x), min(pos_y), max(pos_y)
 
     @property
     def elements(self) -> Iterator[Element]:
         self._require_open()
+        if self._lazy:
+            return map(self._element_at, range(len(self._element_lines)))
         return iter(self._cache_elements)
 
     @property
     def nodes(self) -> Iterator[Node]:
         self._require_open()
-        return iter(self._cache_nodes)
+        return map(self._node_at, range(len(self._node_ids)))
 
     @property
     def node_strings(self) -> Iterator[NodeString]:
@@ -503,6 +602,8 @@ class Reader(ReaderBase):
                 self.num_elements-1 if self._zero_index else self.num_elements)
             raise KeyError(f'Invalid element ID {id_}, element IDs must be '
                            f'between {id_min} and {id_max}')
+        if self._lazy:
+            return self._element_at(id_conf-1)
         return self._cache_elements[id_conf-1]
 
     def node(self, id_: int) -> Node:
@@ -515,14 +616,14 @@ class Reader(ReaderBase):
             id_max = self.num_nodes-1 if self._zero_index else self.num_nodes
             raise KeyError(f'Invalid node ID {id_}, node IDs must be between '
                            f'{id_min} and {id_max}')
-        return self._cache_nodes[id_conf-1]
+        return self._node_at(id_conf-1)
 
     def node_string(self, name: str) -> NodeString:
         self._require_open()
-        for node_string in self.iter_node_strings():
-            if node_string.name == name:
-                return node_string
-        raise KeyError(f'Node string \'{name}\' not found')
+        try:
+            return self._node_strings_by_name[name]
+        except KeyError:
+            raise KeyError(f'Node string \'{name}\' not found') from None
 
     def iter_elements(self, start: int = -1,
                       end: int = -1) -> Iterator[Element]:
@@ -550,6 +651,9 @@ class Reader(ReaderBase):
             raise IndexError('End element ID must be less than or equal to '
                              f'{id_max} ({end})')
         offset = 0 if self._zero_index else -1
+        if self._lazy:
+            indices = range(len(self._element_lines))
+            return map(self._element_at, indices[start+offset:end+offset+1])
         return iter(self._cache_elements[start+offset:end+offset+1])
 
     def iter_nodes(self, start: int = -1, end: int = -1) -> Iterator[Node]:
@@ -577,7 +681,8 @@ class Reader(ReaderBase):
             raise IndexError('End node ID must be less than or equal to '
                              f'{id_max} ({end})')
         offset = 0 if self._zero_index else -1
-        return iter(self._cache_nodes[start+offset:end+offset+1])
+        indices = range(len(self._node_ids))[start+offset:end+offset+1]
+        return map(self._node_at, indices)
 
     def iter_node_strings(self, start: int = 0,
                           end: int = -1) -> Iterator[NodeString]:
@@ -599,3 +704,55 @@ class Reader(ReaderBase):
         if end < 0:
             return iter(self._cache_node_strings[start:])
         return iter(self._cache_node_strings[start:end])
+
+    def _decode_element(self, line: str,
+                        element_type: Type[Element]) -> Element:
+        """Parse an element card, dropping any extra materials.
+
+        :param line: The element card to parse.
+        :type line: :class:`str`
+        :param element_type: The element subclass matching the card.
+        :type element_type: :class:`type` [:class:`py2dm.Element`]
+        :return: The element defined by the given line.
+        :rtype: :class:`py2dm.Element`
+        """
+        element = element_type.from_line(
+            line, allow_zero_index=self._zero_index,
+            allow_float_matid=self._float_materials)
+        # Strip extra elements, sharing the shortened tuple like the
+        # element constructor does for the full one
+        if len(element.materials) > self._num_materials:
+            element.materials = _intern_materials(
+                element.materials[:self._num_materials])
+        return element
+
+    def _element_at(self, index: int) -> Element:
+        """Return the lazily loaded element at the given index.
+
+        The element is decoded from its line on first access and the
+        same instance is returned for any subsequent calls.
+
+        :param index: Zero-based position of the element in the mesh.
+        :type index: :class:`int`
+        :return: The element stored at this position.
+        :rtype: :class:`py2dm.Element`
+        """
+        try:
+            return self._lazy_elements[index]
+        except KeyError:
+            element = self._decode_element(*self._element_lines[index])
+            self._lazy_elements[index] = element
+            return element
+
+    def _node_at(self, index: int) -> Node:
+        """Create the node stored at the given storage index.
+
+        :param index: Zero-based position of the node in the mesh.
+        :type index: :class:`int`
+        :return: A new node instance for the stored ID and position.
+        :rtype: :class:`py2dm.Node`
+        """
+        pos = 3 * index
+        coords = self._node_coords
+        return Node(self._node_ids[index],
+                    coords[pos], coords[pos+1], coords[pos+2])
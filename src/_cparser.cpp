@@ -8,6 +8,7 @@ in a cPython extension.
 #include <Python.h>
 
 #include <assert.h>
+#include <limits>
 #include <string>
 #include <vector>
 
@@ -202,8 +203,9 @@ chunks_from_line(const std::string line)
 /**
  * @brief Convert a string to a long.
  *
- * This uses Python's string parsing strategy to ensure equal fault
- * tolerance.
+ * Plain ASCII integers with an optional minus sign are converted
+ * directly. Anything else uses Python's string parsing strategy to
+ * ensure equal fault tolerance.
  *
  * Raises a Python ValueError if conversion is not possible.
  *
@@ -211,8 +213,32 @@ chunks_from_line(const std::string line)
  * @param err Error flag. Set to true on error.
  * @return Converted long or -1 on error.
  */
-long string_to_long(const std::string s, bool *err)
+long string_to_long(const std::string &s, bool *err)
 {
+    // Fast path: short enough to never overflow a long
+    const bool negative = !s.empty() && s[0] == '-';
+    const size_t start = negative ? 1 : 0;
+    const size_t length = s.size();
+    if (length > start &&
+        length - start <= (size_t)std::numeric_limits<long>::digits10)
+    {
+        long value = 0;
+        size_t i = start;
+        for (; i < length; i++)
+        {
+            const unsigned int digit = (unsigned char)s[i] - '0';
+            if (digit > 9)
+            {
+                break;
+            }
+            value = value * 10 + (long)digit;
+        }
+        if (i == length)
+        {
+            return negative ? -value : value;
+        }
+    }
+    // Slow path: signs, underscores, whitespace, errors, ...
     PyObject *py_l = PyLong_FromString(s.c_str(), nullptr, 10);
     if (PyErr_Occurred())
     {
@@ -232,8 +258,9 @@ long string_to_long(const std::string s, bool *err)
 /**
  * @brief Convert a string to a double.
  *
- * This uses Python's string parsing strategy to ensure equal fault
- * tolderance.
+ * Strings the C-level float parser consumes in full are converted
+ * directly. Anything else uses Python's string parsing strategy to
+ * ensure equal fault tolerance.
  *
  * Raises a Python ValueError if conversion is not possible.
  *
@@ -242,8 +269,18 @@ long string_to_long(const std::string s, bool *err)
  * @return Converted double or -1.0 on error.
  */
 double
-string_to_double(const std::string s, bool *err)
+string_to_double(const std::string &s, bool *err)
 {
+    // Fast path: the same parser float() uses, without creating any
+    // Python objects
+    char *end = nullptr;
+    double value = PyOS_string_to_double(s.c_str(), &end, nullptr);
+    if (!PyErr_Occurred() && end == s.c_str() + s.size())
+    {
+        return value;
+    }
+    PyErr_Clear();
+    // Slow path: underscores, errors, ...
     PyObject *py_s = PyUnicode_FromString(s.c_str());
     PyObject *py_d = PyFloat_FromString(py_s);
     Py_DecRef(py_s);
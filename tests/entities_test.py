@@ -1,10 +1,47 @@
 """Unit tests for all classes representing 2DM entities."""
 
+import math
 import unittest
+import warnings
+from typing import Any, Dict, List, Tuple, Type
 
 import py2dm  # pylint: disable=import-error
 from py2dm._entities import element_factory  # pylint: disable=import-error
 
+_LineCase = Tuple[str, Dict[str, Any], List[str]]
+
+
+def _element_line_cases(card: str, num_nodes: int) -> Tuple[_LineCase, ...]:
+    """Return the expected ``to_line()`` chunks for an element type.
+
+    The element is assumed to be created with ID 1, node IDs 233, 3,
+    4, ... and materials ``(1.0, -2, 5)``.
+    """
+    ids = ['       1', '     233',
+           *(f'{n:8}' for n in range(3, num_nodes + 2))]
+    return (
+        ('default', {}, [card, *ids, ' 1.000e+00', '-2', ' 5']),
+        ('fixed_decimals', {'decimals': 2},
+         [card, *ids, ' 1.00e+00', '-2', ' 5']),
+        ('compact', {'compact': True}, [card, *ids, '1.0', '-2', '5']),
+        ('integer materials only', {'allow_float_matid': False},
+         [card, *ids, '-2', ' 5']),
+    )
+
+
+# Expected to_line() output, built once at import time
+ND_LINE_DEFAULT = [
+    'ND', '       1', ' 1.200000e+01', ' 3.400000e+01', ' 5.600000e+01']
+ND_LINE_DECIMALS = ['ND', '      10', '-1.20e+01', ' 2.00e+01', ' 2.50e+00']
+ND_LINE_COMPACT = ['ND', '       5', '1.23', '2.0', '4.5']
+E2L_LINE_CASES = _element_line_cases('E2L', 2)
+E3L_LINE_CASES = _element_line_cases('E3L', 3)
+E3T_LINE_CASES = _element_line_cases('E3T', 3)
+E4Q_LINE_CASES = _element_line_cases('E4Q', 4)
+E6T_LINE_CASES = _element_line_cases('E6T', 6)
+E8Q_LINE_CASES = _element_line_cases('E8Q', 8)
+E9Q_LINE_CASES = _element_line_cases('E9Q', 9)
+
 
 class TestNode(unittest.TestCase):
     """Tests for the py2dm.Node class."""
@@ -43,8 +80,7 @@ class TestNode(unittest.TestCase):
         self.assertEqual(
             node_1, node_4,
             'separate instance but same value')
-        self.assertNotEqual(
-            node_1, None)
+        self.assertNotEqual(node_1, None)
 
     def test___repr__(self) -> None:
         self.assertEqual(
@@ -54,7 +90,7 @@ class TestNode(unittest.TestCase):
 
     def test_pos(self) -> None:
         node = py2dm.Node(1, 2.0, 3.0, 4.0)
-        self.assertTupleEqual(
+        self.assertEqual(
             node.pos,
             (node.x, node.y, node.z),
             'non-matching coordinates')
@@ -63,58 +99,59 @@ class TestNode(unittest.TestCase):
         with self.subTest('known good'):
             line = 'ND 1 12 34 56'
             node = py2dm.Node.from_line(line)
-            self.assertEqual(
-                node.id, 1,
-                'incorrect node ID')
-            self.assertTupleEqual(
-                node.pos, (12.0, 34.0, 56.0),
-                'incorrect coordinates')
-        with self.subTest('bad card'):
-            line = 'NE 1 1.0 2.0 3.0'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Node.from_line(line)
-        with self.subTest('too few coordinates'):
-            line = 'ND 2 21 43'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Node.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'ND -3 21 43'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Node.from_line(line)
+            self.assertEqual(node.id, 1)
+            self.assertEqual(node.pos, (12.0, 34.0, 56.0))
+        # bad card
+        line = 'NE 1 1.0 2.0 3.0'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Node.from_line(line)
+        # too few coordinates
+        line = 'ND 2 21 43'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Node.from_line(line)
+        # negative node ID
+        line = 'ND -3 21 43'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Node.from_line(line)
         with self.subTest('excess fields'):
             line = 'ND 5 1.0 2.0 3.0 2 0. 0. 0.'
             with self.assertWarns(py2dm.errors.CustomFormatIgnored):
                 node = py2dm.Node.from_line(line)
-                self.assertEqual(
-                    node.id, 5,
-                    'incorrect node ID')
-                self.assertTupleEqual(
-                    node.pos, (1.0, 2.0, 3.0),
-                    'incorrect coordinates')
+                self.assertEqual(node.id, 5)
+                self.assertEqual(node.pos, (1.0, 2.0, 3.0))
 
     def test_to_line(self) -> None:
         with self.subTest('default'):
             node = py2dm.Node(1, 12.0, 34.0, 56.0)
-            self.assertListEqual(
-                node.to_line(),
-                ['ND', '       1', ' 1.200000e+01',
-                 ' 3.400000e+01', ' 5.600000e+01'],
-                'unexpected line chunks')
+            self.assertListEqual(node.to_line(), ND_LINE_DEFAULT)
         with self.subTest('fixed_decimals'):
             node = py2dm.Node(10, -12, 20.0, 2.5)
-            self.assertListEqual(
-                node.to_line(decimals=2),
-                ['ND', '      10', '-1.20e+01', ' 2.00e+01', ' 2.50e+00'],
-                'unexpected line chunks')
+            self.assertListEqual(node.to_line(decimals=2), ND_LINE_DECIMALS)
         with self.subTest('compact'):
             node = py2dm.Node(5, 1.23, 2.0, 4.5)
-            self.assertListEqual(
-                node.to_line(compact=True),
-                ['ND', '       5', '1.23', '2.0', '4.5'],
-                'unexpected line chunks')
+            self.assertListEqual(node.to_line(compact=True), ND_LINE_COMPACT)
+
+
+class _ElementTestCase(unittest.TestCase):
+    """Shared assertions for the element test cases below."""
+
+    def _assert_eq_semantics(self, cls: Type[py2dm.Element],
+                             base: Tuple[int, ...], diff_id: Tuple[int, ...],
+                             diff_nodes: Tuple[int, ...]) -> None:
+        element = cls(*base)
+        self.assertNotEqual(
+            element, cls(*diff_id),
+            'different ID')
+        self.assertNotEqual(
+            element, cls(*diff_nodes),
+            'different nodes')
+        self.assertEqual(
+            element, cls(*base),
+            'separate instance but same value')
+        self.assertNotEqual(element, None)
 
 
-class TestElement2L(unittest.TestCase):
+class TestElement2L(_ElementTestCase):
     """Tests for the py2dm.Element2L class."""
 
     def test_card(self) -> None:
@@ -130,46 +167,31 @@ class TestElement2L(unittest.TestCase):
     def test___init__(self) -> None:
         with self.subTest('known good'):
             element = py2dm.Element2L(1, 2, 3, materials=(4.0, 5))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (4.0, 5),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3))
+            self.assertEqual(element.materials, (4.0, 5))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element3T(1, 2, 3, materials=(3.0, 4))
+        with self.subTest('non-integer node ID'):
+            with self.assertRaisesRegex(TypeError, r'Element2L.*2\.0'):
+                _ = py2dm.Element2L(1, 2.0, 3)
+            element = py2dm.Element2L(1, 2, 3)
+            with self.assertRaisesRegex(TypeError, r'Element2L.*4\.0'):
+                element.nodes = [4.0, 5]
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element2L(1, 2, 3)
-        element_2 = py2dm.Element2L(2, 2, 3)
-        element_3 = py2dm.Element2L(1, 4, 5)
-        element_4 = py2dm.Element2L(1, 2, 3)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element2L, (1, 2, 3), (2, 2, 3), (1, 4, 5))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element2L(12, 3, 4)),
-                '<Element #12 [E2L]: Node IDs (3, 4)>',
-                'unexpected string representation')
+                '<Element #12 [E2L]: Node IDs (3, 4)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element2L(12, 3, 4, materials=(1.0, 2))),
-                '<Element #12 [E2L]: Node IDs (3, 4) Materials (1.0, 2)>',
-                'unexpected string representation')
+                '<Element #12 [E2L]: Node IDs (3, 4) Materials (1.0, 2)>')
 
     def test_num_materials(self) -> None:
         element = py2dm.Element2L(12, 3, 4, materials=(1.0, 2))
@@ -181,83 +203,58 @@ class TestElement2L(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E2L 1 2 3'
             element = py2dm.Element2L.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E2L 2 3 4 5.0 -6'
             element = py2dm.Element2L.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (5.0, -6),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E3L 3 4 5'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element2L.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E2L -4 5 6'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element2L.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E2L 5 -6 7'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element2L.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E2L 4 5'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element2L.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E2L 1 2 3 4.0'
-            _ = py2dm.Element2L.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (5.0, -6))
+        # bad card
+        line = 'E3L 3 4 5'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element2L.from_line(line)
+        # negative element ID
+        line = 'E2L -4 5 6'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element2L.from_line(line)
+        # negative node ID
+        line = 'E2L 5 -6 7'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element2L.from_line(line)
+        # missing nodes
+        line = 'E2L 4 5'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element2L.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element2L(1, 233, 3, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E2L', '       1', '     233', '       3',
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element2L(1, 2, 3, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E2L', *[f'{n:8}' for n in range(1, 4)],
-                 ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element2L(1, 2, 3, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E2L', *[f'{n:8}' for n in range(1, 4)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element2L(1, 2, 3, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E2L', *[f'{n:8}' for n in range(1, 4)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement3L(unittest.TestCase):
+        element = py2dm.Element2L(1, 233, 3, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E2L_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+    def test_to_line_material_ids(self) -> None:
+        # equal integer and float material IDs
+        element = py2dm.Element2L(1, 2, 3, materials=(1, 1.0))
+        self.assertListEqual(
+            element.to_line()[-2:], [' 1', ' 1.000e+00'],
+            'integer and float material IDs formatted alike')
+        # signed zero material IDs, formatted in either order
+        for decimals, values in ((3, (0.0, -0.0)), (4, (-0.0, 0.0))):
+            for value in values:
+                matid = py2dm.Element2L(1, 2, 3, materials=(value,)).to_line(
+                    decimals=decimals)[-1]
+                if math.copysign(1, value) < 0:
+                    self.assertIn('-', matid, f'sign of {value} dropped')
+                else:
+                    self.assertNotIn('-', matid, f'sign added to {value}')
+
+
+class TestElement3L(_ElementTestCase):
     """Tests for the py2dm.Element3L class."""
 
     def test_card(self) -> None:
@@ -273,46 +270,25 @@ class TestElement3L(unittest.TestCase):
     def test___init__(self) -> None:
         with self.subTest('known good'):
             element = py2dm.Element3L(1, 2, 3, 4, materials=(5.0, 6))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (5.0, 6),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4))
+            self.assertEqual(element.materials, (5.0, 6))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element3L(1, 2, 3, materials=(4.0, 5))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element3L(1, 2, 3, 4)
-        element_2 = py2dm.Element3L(2, 2, 3, 4)
-        element_3 = py2dm.Element3L(1, 4, 5, 6)
-        element_4 = py2dm.Element3L(1, 2, 3, 4)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element3L, (1, 2, 3, 4), (2, 2, 3, 4), (1, 4, 5, 6))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element3L(12, 3, 4, 5)),
-                '<Element #12 [E3L]: Node IDs (3, 4, 5)>',
-                'unexpected string representation')
+                '<Element #12 [E3L]: Node IDs (3, 4, 5)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element3L(12, 3, 4, 5, materials=(1.0, 2))),
-                '<Element #12 [E3L]: Node IDs (3, 4, 5) Materials (1.0, 2)>',
-                'unexpected string representation')
+                '<Element #12 [E3L]: Node IDs (3, 4, 5) Materials (1.0, 2)>')
 
     def test_num_materials(self) -> None:
         element = py2dm.Element3L(12, 3, 4, 5, materials=(1.0, 2))
@@ -324,83 +300,42 @@ class TestElement3L(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E3L 1 2 3 4'
             element = py2dm.Element3L.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E3L 2 3 4 5 6.0 -7'
             element = py2dm.Element3L.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (6.0, -7),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E3T 3 4 5 6'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element3L.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E3L -4 5 6 7'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element3L.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E3L 5 -6 7 8'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element3L.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E3L 4 5 6'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element3L.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E3L 1 2 3 4 5.0'
-            _ = py2dm.Element3L.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (6.0, -7))
+        # bad card
+        line = 'E3T 3 4 5 6'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element3L.from_line(line)
+        # negative element ID
+        line = 'E3L -4 5 6 7'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element3L.from_line(line)
+        # negative node ID
+        line = 'E3L 5 -6 7 8'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element3L.from_line(line)
+        # missing nodes
+        line = 'E3L 4 5 6'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element3L.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element3L(1, 233, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E3L', '       1', '     233', '       3', '       4',
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element3L(1, 2, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E3L', *
-                    [f'{n:8}' for n in range(1, 5)], ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element3L(1, 2, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E3L', *[f'{n:8}' for n in range(1, 5)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element3L(1, 2, 3, 4, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E3L', *[f'{n:8}' for n in range(1, 5)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement3T(unittest.TestCase):
+        element = py2dm.Element3L(1, 233, 3, 4, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E3L_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElement3T(_ElementTestCase):
     """Tests for the py2dm.Element3T class."""
 
     def test_card(self) -> None:
@@ -416,46 +351,25 @@ class TestElement3T(unittest.TestCase):
     def test___init__(self) -> None:
         with self.subTest('known good'):
             element = py2dm.Element3T(1, 2, 3, 4, materials=(5.0, 6))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (5.0, 6),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4))
+            self.assertEqual(element.materials, (5.0, 6))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element3T(1, 2, 3, materials=(4.0, 5))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element3T(1, 2, 3, 4)
-        element_2 = py2dm.Element3T(2, 2, 3, 4)
-        element_3 = py2dm.Element3T(1, 4, 5, 6)
-        element_4 = py2dm.Element3T(1, 2, 3, 4)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element3T, (1, 2, 3, 4), (2, 2, 3, 4), (1, 4, 5, 6))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element3T(12, 3, 4, 5)),
-                '<Element #12 [E3T]: Node IDs (3, 4, 5)>',
-                'unexpected string representation')
+                '<Element #12 [E3T]: Node IDs (3, 4, 5)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element3T(12, 3, 4, 5, materials=(1.0, 2))),
-                '<Element #12 [E3T]: Node IDs (3, 4, 5) Materials (1.0, 2)>',
-                'unexpected string representation')
+                '<Element #12 [E3T]: Node IDs (3, 4, 5) Materials (1.0, 2)>')
 
     def test_num_materials(self) -> None:
         element = py2dm.Element3T(12, 3, 4, 5, materials=(1.0, 2))
@@ -467,83 +381,42 @@ class TestElement3T(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E3T 1 2 3 4'
             element = py2dm.Element3T.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E3T 2 3 4 5 6.0 -7'
             element = py2dm.Element3T.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (6.0, -7),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E3L 3 4 5 6'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element3T.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E3T -4 5 6 7'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element3T.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E3T 5 -6 7 8'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element3T.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E3T 4 5 6'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element3T.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E3T 1 2 3 4 5.0'
-            _ = py2dm.Element3T.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (6.0, -7))
+        # bad card
+        line = 'E3L 3 4 5 6'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element3T.from_line(line)
+        # negative element ID
+        line = 'E3T -4 5 6 7'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element3T.from_line(line)
+        # negative node ID
+        line = 'E3T 5 -6 7 8'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element3T.from_line(line)
+        # missing nodes
+        line = 'E3T 4 5 6'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element3T.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element3T(1, 233, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E3T', '       1', '     233', '       3', '       4',
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element3T(1, 2, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E3T', *
-                    [f'{n:8}' for n in range(1, 5)], ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element3T(1, 2, 3, 4, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E3T', *[f'{n:8}' for n in range(1, 5)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element3T(1, 2, 3, 4, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E3T', *[f'{n:8}' for n in range(1, 5)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement4Q(unittest.TestCase):
+        element = py2dm.Element3T(1, 233, 3, 4, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E3T_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElement4Q(_ElementTestCase):
     """Tests for the py2dm.Element4Q class."""
 
     def test_card(self) -> None:
@@ -559,45 +432,26 @@ class TestElement4Q(unittest.TestCase):
     def test___init__(self) -> None:
         with self.subTest('known good'):
             element = py2dm.Element4Q(1, 2, 3, 4, 5, materials=(6.0, 7))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (6.0, 7),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5))
+            self.assertEqual(element.materials, (6.0, 7))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element4Q(1, 2, 3, 4, materials=(5.0, 6))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element4Q(1, 2, 3, 4, 5)
-        element_2 = py2dm.Element4Q(2, 2, 3, 4, 5)
-        element_3 = py2dm.Element4Q(1, 4, 5, 6, 7)
-        element_4 = py2dm.Element4Q(1, 2, 3, 4, 5)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
+        self._assert_eq_semantics(
+            py2dm.Element4Q, (1, 2, 3, 4, 5), (2, 2, 3, 4, 5), (1, 4, 5, 6, 7))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element4Q(12, 3, 4, 5, 6)),
-                '<Element #12 [E4Q]: Node IDs (3, 4, 5, 6)>',
-                'unexpected string representation')
+                '<Element #12 [E4Q]: Node IDs (3, 4, 5, 6)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element4Q(12, 3, 4, 5, 6, materials=(1.0, 2))),
                 ('<Element #12 [E4Q]: Node IDs (3, 4, 5, 6) '
-                 'Materials (1.0, 2)>'),
-                'unexpected string representation')
+                 'Materials (1.0, 2)>'))
 
     def test_num_materials(self) -> None:
         element = py2dm.Element4Q(12, 3, 4, 5, 6, materials=(1.0, 2))
@@ -609,84 +463,42 @@ class TestElement4Q(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E4Q 1 2 3 4 5'
             element = py2dm.Element4Q.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E4Q 2 3 4 5 6 7.0 -8'
             element = py2dm.Element4Q.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5, 6),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (7.0, -8),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E2L 3 4 5 6 7'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element4Q.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E4Q -4 5 6 7 8'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element4Q.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E4Q 5 -6 7 8 9'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element4Q.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E4Q 4 5 6 7'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element4Q.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E4Q 1 2 3 4 5 6.0'
-            _ = py2dm.Element4Q.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5, 6))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (7.0, -8))
+        # bad card
+        line = 'E2L 3 4 5 6 7'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element4Q.from_line(line)
+        # negative element ID
+        line = 'E4Q -4 5 6 7 8'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element4Q.from_line(line)
+        # negative node ID
+        line = 'E4Q 5 -6 7 8 9'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element4Q.from_line(line)
+        # missing nodes
+        line = 'E4Q 4 5 6 7'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element4Q.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element4Q(1, 233, 3, 4, 5, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E4Q', '       1', '     233',
-                 *[f'{n:8}' for n in range(3, 6)],
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element4Q(1, 2, 3, 4, 5, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E4Q', *
-                    [f'{n:8}' for n in range(1, 6)], ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element4Q(1, 2, 3, 4, 5, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E4Q', *[f'{n:8}' for n in range(1, 6)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element4Q(1, 2, 3, 4, 5, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E4Q', *[f'{n:8}' for n in range(1, 6)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement6T(unittest.TestCase):
+        element = py2dm.Element4Q(1, 233, 3, 4, 5, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E4Q_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElement6T(_ElementTestCase):
     """Tests for the py2dm.Element6T class."""
 
     def test_card(self) -> None:
@@ -702,48 +514,28 @@ class TestElement6T(unittest.TestCase):
     def test___init__(self) -> None:
         with self.subTest('known good'):
             element = py2dm.Element(1, 2, 3, 4, 5, 6, 7, materials=(8.0, 9))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (8.0, 9),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7))
+            self.assertEqual(element.materials, (8.0, 9))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element6T(1, 2, 3, 4, 5, 6, materials=(7.0, 8))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element6T(1, 2, 3, 4, 5, 6, 7)
-        element_2 = py2dm.Element6T(2, 2, 3, 4, 5, 6, 7)
-        element_3 = py2dm.Element6T(1, 4, 5, 6, 7, 8, 9)
-        element_4 = py2dm.Element6T(1, 2, 3, 4, 5, 6, 7)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element6T, (1, 2, 3, 4, 5, 6, 7), (2, 2, 3, 4, 5, 6, 7),
+            (1, 4, 5, 6, 7, 8, 9))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element6T(12, 3, 4, 5, 6, 7, 8)),
-                '<Element #12 [E6T]: Node IDs (3, 4, 5, 6, 7, 8)>',
-                'unexpected string representation')
+                '<Element #12 [E6T]: Node IDs (3, 4, 5, 6, 7, 8)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element6T(
                     12, 3, 4, 5, 6, 7, 8, materials=(1.0, 2))),
                 ('<Element #12 [E6T]: Node IDs (3, 4, 5, 6, 7, 8) '
-                 'Materials (1.0, 2)>'),
-                'unexpected string representation')
+                 'Materials (1.0, 2)>'))
 
     def test_num_materials(self) -> None:
         element = py2dm.Element6T(12, 3, 4, 5, 6, 7, 8, materials=(1.0, 2))
@@ -755,87 +547,43 @@ class TestElement6T(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E6T 1 2 3 4 5 6 7'
             element = py2dm.Element6T.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E6T 2 3 4 5 6 7 8 9.0 -10'
             element = py2dm.Element6T.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5, 6, 7, 8),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (9.0, -10),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E3T 3 4 5 6 7 8 9'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element6T.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E6T -4 5 6 7 8 9 10'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element6T.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E6T 5 -6 7 8 9 10 11'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element6T.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E6T 6 7 8 9 10 11'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element6T.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E6T 1 2 3 4 5 6 7 8.0'
-            _ = py2dm.Element6T.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5, 6, 7, 8))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (9.0, -10))
+        # bad card
+        line = 'E3T 3 4 5 6 7 8 9'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element6T.from_line(line)
+        # negative element ID
+        line = 'E6T -4 5 6 7 8 9 10'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element6T.from_line(line)
+        # negative node ID
+        line = 'E6T 5 -6 7 8 9 10 11'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element6T.from_line(line)
+        # missing nodes
+        line = 'E6T 6 7 8 9 10 11'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element6T.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element6T(
-                1, 233, 3, 4, 5, 6, 7, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E6T', '       1', '     233', *[f'{n:8}' for n in range(3, 8)],
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element6T(
-                1, 2, 3, 4, 5, 6, 7, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E6T', *[f'{n:8}' for n in range(1, 8)],
-                 ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element6T(
-                1, 2, 3, 4, 5, 6, 7, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E6T', *[f'{n:8}' for n in range(1, 8)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element6T(
-                1, 2, 3, 4, 5, 6, 7, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E6T', *[f'{n:8}' for n in range(1, 8)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement8Q(unittest.TestCase):
+        element = py2dm.Element6T(
+            1, 233, 3, 4, 5, 6, 7, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E6T_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElement8Q(_ElementTestCase):
     """Tests for the py2dm.Element8Q class."""
 
     def test_card(self) -> None:
@@ -852,48 +600,28 @@ class TestElement8Q(unittest.TestCase):
         with self.subTest('known good'):
             element = py2dm.Element(
                 1, 2, 3, 4, 5, 6, 7, 8, 9, materials=(10.0, 11))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7, 8, 9),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (10.0, 11),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7, 8, 9))
+            self.assertEqual(element.materials, (10.0, 11))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element8Q(1, 2, 3, 4, 5, 6, 7, 8, materials=(9.0, 10))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element8Q(1, 2, 3, 4, 5, 6, 7, 8, 9)
-        element_2 = py2dm.Element8Q(2, 2, 3, 4, 5, 6, 7, 8, 9)
-        element_3 = py2dm.Element8Q(1, 4, 5, 6, 7, 8, 9, 10, 11)
-        element_4 = py2dm.Element8Q(1, 2, 3, 4, 5, 6, 7, 8, 9)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element8Q, (1, 2, 3, 4, 5, 6, 7, 8, 9),
+            (2, 2, 3, 4, 5, 6, 7, 8, 9), (1, 4, 5, 6, 7, 8, 9, 10, 11))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element8Q(12, 3, 4, 5, 6, 7, 8, 9, 10)),
-                '<Element #12 [E8Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10)>',
-                'unexpected string representation')
+                '<Element #12 [E8Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element8Q(
                     12, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, 2))),
                 ('<Element #12 [E8Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10) '
-                 'Materials (1.0, 2)>'),
-                'unexpected string representation')
+                 'Materials (1.0, 2)>'))
 
     def test_num_materials(self) -> None:
         element = py2dm.Element8Q(
@@ -906,88 +634,43 @@ class TestElement8Q(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E8Q 1 2 3 4 5 6 7 8 9'
             element = py2dm.Element8Q.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7, 8, 9),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7, 8, 9))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E8Q 2 3 4 5 6 7 8 9 10 11.0 -12'
             element = py2dm.Element8Q.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5, 6, 7, 8, 9, 10),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (11.0, -12),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E4Q 3 4 5 6 7 8 9 10 11'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element8Q.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E8Q -4 5 6 7 8 9 10 11 12'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element8Q.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E8Q 5 -6 7 8 9 10 11 12 13'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element8Q.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E8Q 6 7 8 9 10 11 12 13'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element8Q.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E8Q 1 2 3 4 5 6 7 8 9 10.0'
-            _ = py2dm.Element8Q.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5, 6, 7, 8, 9, 10))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (11.0, -12))
+        # bad card
+        line = 'E4Q 3 4 5 6 7 8 9 10 11'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element8Q.from_line(line)
+        # negative element ID
+        line = 'E8Q -4 5 6 7 8 9 10 11 12'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element8Q.from_line(line)
+        # negative node ID
+        line = 'E8Q 5 -6 7 8 9 10 11 12 13'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element8Q.from_line(line)
+        # missing nodes
+        line = 'E8Q 6 7 8 9 10 11 12 13'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element8Q.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element8Q(
-                1, 233, 3, 4, 5, 6, 7, 8, 9, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E8Q', '       1', '     233',
-                 *[f'{n:8}' for n in range(3, 10)],
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element8Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E8Q', *[f'{n:8}' for n in range(1, 10)],
-                 ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element8Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E8Q', *[f'{n:8}' for n in range(1, 10)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element8Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E8Q', *[f'{n:8}' for n in range(1, 10)], '-2'],
-                'unexpected line chunks')
-
-
-class TestElement9Q(unittest.TestCase):
+        element = py2dm.Element8Q(
+            1, 233, 3, 4, 5, 6, 7, 8, 9, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E8Q_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElement9Q(_ElementTestCase):
     """Tests for the py2dm.Element9Q class."""
 
     def test_card(self) -> None:
@@ -1004,49 +687,30 @@ class TestElement9Q(unittest.TestCase):
         with self.subTest('known good'):
             element = py2dm.Element(
                 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, materials=(11.0, 12))
-            self.assertEqual(
-                element.id, 1,
-                'bad ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7, 8, 9, 10),
-                'bad nodes')
-            self.assertTupleEqual(
-                element.materials, (11.0, 12),
-                'bad materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7, 8, 9, 10))
+            self.assertEqual(element.materials, (11.0, 12))
         with self.assertRaises(py2dm.errors.CardError):
             _ = py2dm.Element9Q(
                 1, 2, 3, 4, 5, 6, 7, 8, 9, materials=(10.0, 11))
 
     def test___eq__(self) -> None:
-        element_1 = py2dm.Element9Q(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
-        element_2 = py2dm.Element9Q(2, 2, 3, 4, 5, 6, 7, 8, 9, 10)
-        element_3 = py2dm.Element9Q(1, 4, 5, 6, 7, 8, 9, 10, 11, 12)
-        element_4 = py2dm.Element9Q(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
-        self.assertNotEqual(
-            element_1, element_2,
-            'different ID')
-        self.assertNotEqual(
-            element_1, element_3,
-            'different nodes')
-        self.assertEqual(
-            element_1, element_4,
-            'separate instance but same value')
-        self.assertNotEqual(
-            element_1, None)
+        self._assert_eq_semantics(
+            py2dm.Element9Q, (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+            (2, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+            (1, 4, 5, 6, 7, 8, 9, 10, 11, 12))
 
     def test___repr__(self) -> None:
         with self.subTest('no materials'):
             self.assertEqual(
                 repr(py2dm.Element9Q(12, 3, 4, 5, 6, 7, 8, 9, 10, 11)),
-                '<Element #12 [E9Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10, 11)>',
-                'unexpected string representation')
+                '<Element #12 [E9Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10, 11)>')
         with self.subTest('w/ materials'):
             self.assertEqual(
                 repr(py2dm.Element9Q(
                     12, 3, 4, 5, 6, 7, 8, 9, 10, 11, materials=(1.0, 2))),
                 ('<Element #12 [E9Q]: Node IDs (3, 4, 5, 6, 7, 8, 9, 10, 11) '
-                 'Materials (1.0, 2)>'),
-                'unexpected string representation')
+                 'Materials (1.0, 2)>'))
 
     def test_num_materials(self) -> None:
         element = py2dm.Element9Q(
@@ -1059,85 +723,67 @@ class TestElement9Q(unittest.TestCase):
         with self.subTest('known good'):
             line = 'E9Q 1 2 3 4 5 6 7 8 9 10'
             element = py2dm.Element9Q.from_line(line)
-            self.assertEqual(
-                element.id, 1,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (2, 3, 4, 5, 6, 7, 8, 9, 10),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 0,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (),
-                'incorrect materials')
+            self.assertEqual(element.id, 1)
+            self.assertEqual(element.nodes, (2, 3, 4, 5, 6, 7, 8, 9, 10))
+            self.assertEqual(element.num_materials, 0)
+            self.assertEqual(element.materials, ())
         with self.subTest('known good w/ materials'):
             line = 'E9Q 2 3 4 5 6 7 8 9 10 11 12.0 -13'
             element = py2dm.Element9Q.from_line(line)
-            self.assertEqual(
-                element.id, 2,
-                'incorrect element ID')
-            self.assertTupleEqual(
-                element.nodes, (3, 4, 5, 6, 7, 8, 9, 10, 11),
-                'incorrect nodes')
-            self.assertEqual(
-                element.num_materials, 2,
-                'incorrect material count')
-            self.assertTupleEqual(
-                element.materials, (12.0, -13),
-                'incorrect materials')
-        with self.subTest('bad card'):
-            line = 'E8Q 3 4 5 6 7 8 9 10 11 12'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element9Q.from_line(line)
-        with self.subTest('negative element ID'):
-            line = 'E9Q -4 5 6 7 8 9 10 11 12 13'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element9Q.from_line(line)
-        with self.subTest('negative node ID'):
-            line = 'E9Q 5 -6 7 8 9 10 11 12 13 14'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.Element9Q.from_line(line)
-        with self.subTest('missing nodes'):
-            line = 'E9Q 6 7 8 9 10 11 12 13 14'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.Element9Q.from_line(line)
-        with self.assertWarns(py2dm.errors.CustomFormatIgnored):
-            line = 'E9Q 1 2 3 4 5 6 7 8 9 10 11.0'
-            _ = py2dm.Element9Q.from_line(line, allow_float_matid=False)
+            self.assertEqual(element.id, 2)
+            self.assertEqual(element.nodes, (3, 4, 5, 6, 7, 8, 9, 10, 11))
+            self.assertEqual(element.num_materials, 2)
+            self.assertEqual(element.materials, (12.0, -13))
+        # bad card
+        line = 'E8Q 3 4 5 6 7 8 9 10 11 12'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element9Q.from_line(line)
+        # negative element ID
+        line = 'E9Q -4 5 6 7 8 9 10 11 12 13'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element9Q.from_line(line)
+        # negative node ID
+        line = 'E9Q 5 -6 7 8 9 10 11 12 13 14'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.Element9Q.from_line(line)
+        # missing nodes
+        line = 'E9Q 6 7 8 9 10 11 12 13 14'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.Element9Q.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            element = py2dm.Element9Q(
-                1, 233, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(),
-                ['E9Q', '       1', '     233',
-                 *[f'{n:8}' for n in range(3, 11)],
-                 ' 1.000e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('fixed_decimals'):
-            element = py2dm.Element9Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(decimals=2),
-                ['E9Q', *[f'{n:8}' for n in range(1, 11)],
-                 ' 1.00e+00', '-2', ' 5'],
-                'unexpected line chunks')
-        with self.subTest('compact'):
-            element = py2dm.Element9Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, -2, 5))
-            self.assertListEqual(
-                element.to_line(compact=True),
-                ['E9Q', *[f'{n:8}' for n in range(1, 11)], '1.0', '-2', '5'],
-                'unexpected line chunks')
-        with self.subTest('integer materials only'):
-            element = py2dm.Element9Q(
-                1, 2, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, -2))
-            self.assertListEqual(
-                element.to_line(allow_float_matid=False),
-                ['E9Q', *[f'{n:8}' for n in range(1, 11)], '-2'],
-                'unexpected line chunks')
+        element = py2dm.Element9Q(
+            1, 233, 3, 4, 5, 6, 7, 8, 9, 10, materials=(1.0, -2, 5))
+        for label, kwargs, expected in E9Q_LINE_CASES:
+            with self.subTest(label):
+                self.assertListEqual(element.to_line(**kwargs), expected)
+
+
+class TestElementWarnings(unittest.TestCase):
+    """Tests for warnings shared by all element classes."""
+
+    def test_from_line_float_matid(self) -> None:
+        cases = [
+            (py2dm.Element2L, 'E2L 1 2 3 4.0'),
+            (py2dm.Element3L, 'E3L 1 2 3 4 5.0'),
+            (py2dm.Element3T, 'E3T 1 2 3 4 5.0'),
+            (py2dm.Element4Q, 'E4Q 1 2 3 4 5 6.0'),
+            (py2dm.Element6T, 'E6T 1 2 3 4 5 6 7 8.0'),
+            (py2dm.Element8Q, 'E8Q 1 2 3 4 5 6 7 8 9 10.0'),
+            (py2dm.Element9Q, 'E9Q 1 2 3 4 5 6 7 8 9 10 11.0'),
+        ]
+        # A single recording context for all cases; the per-case slice
+        # ensures every line warns, not just one of them.
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for cls, line in cases:
+                start = len(caught)
+                _ = cls.from_line(line, allow_float_matid=False)
+                with self.subTest(cls.card):
+                    self.assertTrue(any(
+                        issubclass(w.category,
+                                   py2dm.errors.CustomFormatIgnored)
+                        for w in caught[start:]))
 
 
 class TestNodeString(unittest.TestCase):
@@ -1153,13 +799,15 @@ class TestNodeString(unittest.TestCase):
         self.assertEqual(
             node_string.num_nodes, 4,
             'bad node count')
-        self.assertTupleEqual(
+        self.assertEqual(
             node_string.nodes,
             (1, 2, 3, 4),
             'bad nodes tuple')
         self.assertEqual(
             node_string.name, 'one',
             'bad node string name')
+        with self.assertRaisesRegex(TypeError, r'NodeString.*3\.0'):
+            _ = py2dm.NodeString(1, 2, 3.0)
 
     def test___eq__(self) -> None:
         node_string_1 = py2dm.NodeString(1, 2, 3, 4)
@@ -1171,177 +819,116 @@ class TestNodeString(unittest.TestCase):
         self.assertEqual(
             node_string_1, node_string_3,
             'separate instance but same value')
-        self.assertNotEqual(
-            node_string_1, None)
+        self.assertNotEqual(node_string_1, None)
 
     def test___repr__(self) -> None:
         with self.subTest('unnamed'):
             self.assertEqual(
                 repr(py2dm.NodeString(1, 2, 3, 4, 5)),
-                '<Unnamed NodeString: (1, 2, 3, 4, 5)>',
-                'unexpected string representation')
+                '<Unnamed NodeString: (1, 2, 3, 4, 5)>')
         with self.subTest('named'):
             self.assertEqual(
                 repr(py2dm.NodeString(1, 2, 3, 4, 5, name='my node string')),
-                '<NodeString "my node string": (1, 2, 3, 4, 5)>',
-                'unexpected string representation')
+                '<NodeString "my node string": (1, 2, 3, 4, 5)>')
 
     def test_from_line(self) -> None:
         with self.subTest('known good (short)'):
             line = 'NS 1 2 3 4 5 -6'
             node_string, is_done = py2dm.NodeString.from_line(line)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 6,
-                'unexpected number of nodes')
-            self.assertIsNone(
-                node_string.name,
-                'node string name is not None')
-            self.assertTupleEqual(
-                node_string.nodes, (1, 2, 3, 4, 5, 6),
-                'bad nodes tuple')
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 6)
+            self.assertIsNone(node_string.name)
+            self.assertEqual(node_string.nodes, (1, 2, 3, 4, 5, 6))
         with self.subTest('known good (multiline)'):
             line_1 = 'NS 1 2 3 4 5 6 7 8 9 10'
             line_2 = 'NS 11 12 13 14 15 16 17 18 19 20'
             line_3 = 'NS 21 22 23 24 25 26 27 28 29 -30'
             node_string, is_done = py2dm.NodeString.from_line(line_1)
-            self.assertFalse(
-                is_done,
-                'node string incorrectly flagged as done')
+            self.assertFalse(is_done)
             node_string, is_done = py2dm.NodeString.from_line(
                 line_2, node_string)
-            self.assertFalse(
-                is_done,
-                'node string incorrectly flagged as done')
+            self.assertFalse(is_done)
             node_string, is_done = py2dm.NodeString.from_line(
                 line_3, node_string)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 30,
-                'unexpected number of nodes')
-            self.assertIsNone(
-                node_string.name,
-                'node string name is not None')
-            self.assertTupleEqual(
-                node_string.nodes, tuple(range(1, 31)),
-                'bad nodes tuple')
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 30)
+            self.assertIsNone(node_string.name)
+            self.assertEqual(node_string.nodes, tuple(range(1, 31)))
         with self.subTest('known good (more than 10 fields)'):
             line = 'NS 1 2 3 4 5 6 7 8 9 10 11 12 13 14 -15'
             node_string, is_done = py2dm.NodeString.from_line(line)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 15,
-                'unexpected number of nodes')
-            self.assertIsNone(
-                node_string.name,
-                'node string name is not None')
-            self.assertTupleEqual(
-                node_string.nodes, tuple(range(1, 16)),
-                'bad nodes tuple')
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 15)
+            self.assertIsNone(node_string.name)
+            self.assertEqual(node_string.nodes, tuple(range(1, 16)))
         with self.subTest('numerical identifier'):
             line = 'NS 1 2 3 4 5 6 7 8 9 -10 11'
             node_string, is_done = py2dm.NodeString.from_line(line)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 10,
-                'unexpected number of nodes')
-            self.assertEqual(
-                node_string.name, '11',
-                'bad node string name')
-            self.assertTupleEqual(
-                node_string.nodes, tuple(range(1, 11)),
-                'bad nodes tuple')
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 10)
+            self.assertEqual(node_string.name, '11')
+            self.assertEqual(node_string.nodes, tuple(range(1, 11)))
         with self.subTest('string identifier (unquoted)'):
             line = 'NS 1 2 3 4 5 6 7 -8 lorem'
             node_string, is_done = py2dm.NodeString.from_line(line)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 8,
-                'unexpected number of nodes')
-            self.assertEqual(
-                node_string.name, 'lorem',
-                'bad node string name')
-            self.assertTupleEqual(
-                node_string.nodes, tuple(range(1, 9)),
-                'bad nodes tuple')
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 8)
+            self.assertEqual(node_string.name, 'lorem')
+            self.assertEqual(node_string.nodes, tuple(range(1, 9)))
         with self.subTest('string identifier (double quoted)'):
             line = 'NS 1 2 3 4 5 6 7 8 9 10 11 -12 "ipsum"'
             node_string, is_done = py2dm.NodeString.from_line(line)
-            self.assertTrue(
-                is_done,
-                'node string not flagged as done')
-            self.assertEqual(
-                node_string.num_nodes, 12,
-                'unexpected number of nodes')
-            self.assertEqual(
-                node_string.name, 'ipsum',
-                'bad node string name')
-            self.assertTupleEqual(
-                node_string.nodes, tuple(range(1, 13)),
-                'bad nodes tuple')
-        with self.subTest('bad card'):
-            line = 'ND 1 2 3 4 -5'
-            with self.assertRaises(py2dm.errors.CardError):
-                _ = py2dm.NodeString.from_line(line)
-        with self.subTest('too few nodes'):
-            line = 'NS -1'
-            with self.assertRaises(py2dm.errors.FormatError):
-                _ = py2dm.NodeString.from_line(line)
+            self.assertTrue(is_done)
+            self.assertEqual(node_string.num_nodes, 12)
+            self.assertEqual(node_string.name, 'ipsum')
+            self.assertEqual(node_string.nodes, tuple(range(1, 13)))
+        # bad card
+        line = 'ND 1 2 3 4 -5'
+        with self.assertRaises(py2dm.errors.CardError):
+            _ = py2dm.NodeString.from_line(line)
+        # too few nodes
+        line = 'NS -1'
+        with self.assertRaises(py2dm.errors.FormatError):
+            _ = py2dm.NodeString.from_line(line)
 
     def test_to_line(self) -> None:
-        with self.subTest('default'):
-            node_string = py2dm.NodeString(*range(1, 15))
-            self.assertListEqual(
-                node_string.to_line(),
-                ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
-                 'NS', '11', '12', '13', '-14'],
-                'unexpected line chunks')
-        with self.subTest('single line'):
-            node_string = py2dm.NodeString(*range(1, 15))
-            self.assertListEqual(
-                node_string.to_line(fold_after=0),
-                ['NS', '1', '2', '3', '4', '5', '6', '7',
-                 '8', '9', '10', '11', '12', '13', '-14'],
-                'unexpected line chunks')
-        with self.subTest('custom fold'):
-            node_string = py2dm.NodeString(*range(1, 15))
-            self.assertListEqual(
-                node_string.to_line(fold_after=5),
-                ['NS', '1', '2', '3', '4', '5', '\n',
-                 'NS', '6', '7', '8', '9', '10', '\n',
-                 'NS', '11', '12', '13', '-14'],
-                'unexpected line chunks')
-        with self.subTest('default w/ name'):
-            node_string = py2dm.NodeString(*range(1, 15), name='test')
-            self.assertListEqual(
-                node_string.to_line(),
-                ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
-                 'NS', '11', '12', '13', '-14', 'test'],
-                'unexpected line chunks')
-        with self.subTest('single line w/ name'):
-            node_string = py2dm.NodeString(*range(1, 15), name='test')
-            self.assertListEqual(
-                node_string.to_line(fold_after=0),
-                ['NS', '1', '2', '3', '4', '5', '6', '7',
-                 '8', '9', '10', '11', '12', '13', '-14', 'test'],
-                'unexpected line chunks')
-        with self.subTest('name excluded'):
-            node_string = py2dm.NodeString(*range(1, 15), name='test')
-            self.assertListEqual(
-                node_string.to_line(include_name=False),
-                ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
-                 'NS', '11', '12', '13', '-14'],
-                'unexpected line chunks')
+        # default
+        node_string = py2dm.NodeString(*range(1, 15))
+        self.assertEqual(
+            node_string.to_line(),
+            ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
+             'NS', '11', '12', '13', '-14'])
+        # single line
+        node_string = py2dm.NodeString(*range(1, 15))
+        self.assertEqual(
+            node_string.to_line(fold_after=0),
+            ['NS', '1', '2', '3', '4', '5', '6', '7',
+             '8', '9', '10', '11', '12', '13', '-14'])
+        # custom fold
+        node_string = py2dm.NodeString(*range(1, 15))
+        self.assertEqual(
+            node_string.to_line(fold_after=5),
+            ['NS', '1', '2', '3', '4', '5', '\n',
+             'NS', '6', '7', '8', '9', '10', '\n',
+             'NS', '11', '12', '13', '-14'])
+        # default w/ name
+        node_string = py2dm.NodeString(*range(1, 15), name='test')
+        self.assertEqual(
+            node_string.to_line(),
+            ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
+             'NS', '11', '12', '13', '-14', 'test'])
+        # single line w/ name
+        node_string = py2dm.NodeString(*range(1, 15), name='test')
+        self.assertEqual(
+            node_string.to_line(fold_after=0),
+            ['NS', '1', '2', '3', '4', '5', '6', '7',
+             '8', '9', '10', '11', '12', '13', '-14', 'test'])
+        # name excluded
+        node_string = py2dm.NodeString(*range(1, 15), name='test')
+        self.assertEqual(
+            node_string.to_line(include_name=False),
+            ['NS', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '\n',
+             'NS', '11', '12', '13', '-14'])
 
 
 class TestElementFactory(unittest.TestCase):
@@ -1358,9 +945,7 @@ class TestElementFactory(unittest.TestCase):
         for card, instance in elements.items():
             with self.subTest(f'{card} element'):
                 line = f'{card} 1 2 3 4 5 6 7 8.0 -9 # 10'
-                self.assertEqual(
-                    element_factory(line), instance,
-                    'wrong class returned')
-        with self.subTest('fallback error'):
-            with self.assertRaises(NotImplementedError):
-                element_factory('NOT-AN-ELEMENT lorem ipsum dolor sit amet')
+                self.assertEqual(element_factory(line), instance)
+        # fallback error
+        with self.assertRaises(NotImplementedError):
+            element_factory('NOT-AN-ELEMENT lorem ipsum dolor sit amet')
@@ -2,16 +2,34 @@
 
 import math
 import os
+import struct
 from typing import Iterator
 import unittest
+import warnings
 
 import py2dm  # pylint: disable=import-error
 
+_TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
 
 class TestReader(unittest.TestCase):
     """Tests for the py2dm.Reader class."""
 
-    _PATH = os.path.join('tests', 'data', 'basic-node-strings.2dm')
+    _PATH = os.path.join(_TEST_DATA, 'basic-node-strings.2dm')
+
+    _mesh: py2dm.Reader
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Shared reader for tests that do not open or close it
+        cls._mesh = py2dm.Reader(cls._PATH)
+        cls._mesh.open()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        cls._mesh.close()
 
     def test___init__(self) -> None:
         reader = py2dm.Reader(self._PATH)
@@ -59,98 +77,98 @@ class TestReader(unittest.TestCase):
             'unexpected string representation')
 
     def test_extent(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertTupleEqual(
-                mesh.extent, (-5.0, 5.0, -5.0, 5.0),
-                'incorrect mesh extent')
+        mesh = self._mesh
+        self.assertTupleEqual(
+            mesh.extent, (-5.0, 5.0, -5.0, 5.0),
+            'incorrect mesh extent')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
         with self.subTest('empty'):
-            path = os.path.join('tests', 'data', 'empty-mesh.2dm')
+            path = os.path.join(_TEST_DATA, 'empty-mesh.2dm')
             with py2dm.Reader(path) as mesh:
                 self.assertTrue(
                     all((math.isnan(f) for f in mesh.extent)),
                     'mesh extent not empty')
 
     def test_elements(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertIsInstance(
-                mesh.elements, Iterator,
-                'not subclass of iterator')
-            self.assertListEqual(
-                list(mesh.elements),
-                list(mesh.iter_elements()),
-                'differing elements list')
+        mesh = self._mesh
+        self.assertIsInstance(
+            mesh.elements, Iterator,
+            'not subclass of iterator')
+        self.assertListEqual(
+            list(mesh.elements),
+            list(mesh.iter_elements()),
+            'differing elements list')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.elements
 
     def test_nodes(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertIsInstance(
-                mesh.nodes, Iterator,
-                'not subclass of iterator')
-            self.assertListEqual(
-                list(mesh.nodes),
-                list(mesh.iter_nodes()),
-                'differing nodes list')
+        mesh = self._mesh
+        self.assertIsInstance(
+            mesh.nodes, Iterator,
+            'not subclass of iterator')
+        self.assertListEqual(
+            list(mesh.nodes),
+            list(mesh.iter_nodes()),
+            'differing nodes list')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.nodes
 
     def test_node_strings(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertIsInstance(
-                mesh.node_strings, Iterator,
-                'not subclass of iterator')
-            self.assertListEqual(
-                list(mesh.node_strings),
-                list(mesh.iter_node_strings()),
-                'differing node strings list')
+        mesh = self._mesh
+        self.assertIsInstance(
+            mesh.node_strings, Iterator,
+            'not subclass of iterator')
+        self.assertListEqual(
+            list(mesh.node_strings),
+            list(mesh.iter_node_strings()),
+            'differing node strings list')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.node_strings
 
     def test_materials_per_element(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertEqual(
-                mesh.materials_per_element, 0,
-                'bad material count')
+        mesh = self._mesh
+        self.assertEqual(
+            mesh.materials_per_element, 0,
+            'bad material count')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.materials_per_element
 
     def test_num_elements(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertEqual(
-                mesh.num_elements, 4,
-                'bad element count')
+        mesh = self._mesh
+        self.assertEqual(
+            mesh.num_elements, 4,
+            'bad element count')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.num_elements
 
     def test_num_nodes(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertEqual(
-                mesh.num_nodes, 5,
-                'bad node count')
+        mesh = self._mesh
+        self.assertEqual(
+            mesh.num_nodes, 5,
+            'bad node count')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.num_nodes
 
     def test_num_node_strings(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            self.assertEqual(
-                mesh.num_node_strings, 2,
-                'bad node string count')
+        mesh = self._mesh
+        self.assertEqual(
+            mesh.num_node_strings, 2,
+            'bad node string count')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
@@ -175,186 +193,185 @@ class TestReader(unittest.TestCase):
             _ = reader.element(1)
 
     def test_element(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('valid'):
-                self.assertEqual(
-                    mesh.element(1),
-                    py2dm.Element3T(1, 1, 2, 3),
-                    'unexpected element')
-            with self.subTest('too low'):
-                with self.assertRaises(KeyError):
-                    _ = mesh.element(0)
-            with self.subTest('too high'):
-                with self.assertRaises(KeyError):
-                    _ = mesh.element(5)
+        mesh = self._mesh
+        with self.subTest('valid'):
+            self.assertEqual(
+                mesh.element(1),
+                py2dm.Element3T(1, 1, 2, 3),
+                'unexpected element')
+        with self.subTest('too low'):
+            with self.assertRaises(KeyError):
+                _ = mesh.element(0)
+        with self.subTest('too high'):
+            with self.assertRaises(KeyError):
+                _ = mesh.element(5)
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
 
     def test_node(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('valid'):
-                self.assertEqual(
-                    mesh.node(2),
-                    py2dm.Node(2, -5.0, 5.0, 2.0),
-                    'unexpected node')
-            with self.subTest('too low'):
-                with self.assertRaises(KeyError):
-                    _ = mesh.node(0)
-            with self.subTest('too high'):
-                with self.assertRaises(KeyError):
-                    _ = mesh.node(6)
+        mesh = self._mesh
+        with self.subTest('valid'):
+            self.assertEqual(
+                mesh.node(2),
+                py2dm.Node(2, -5.0, 5.0, 2.0),
+                'unexpected node')
+        with self.subTest('too low'):
+            with self.assertRaises(KeyError):
+                _ = mesh.node(0)
+        with self.subTest('too high'):
+            with self.assertRaises(KeyError):
+                _ = mesh.node(6)
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
 
     def test_node_string(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('valid'):
-                self.assertEqual(
-                    mesh.node_string('first'),
-                    py2dm.NodeString(1, 2, 4, 3, name='first'),
-                    'unexpected node string')
-            with self.subTest('bad name'):
-                with self.assertRaises(KeyError):
-                    _ = mesh.node_string('third')
+        mesh = self._mesh
+        with self.subTest('valid'):
+            self.assertEqual(
+                mesh.node_string('first'),
+                py2dm.NodeString(1, 2, 4, 3, name='first'),
+                'unexpected node string')
+        with self.subTest('bad name'):
+            with self.assertRaises(KeyError):
+                _ = mesh.node_string('third')
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
 
     def test_iter_elements(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('full'):
-                self.assertListEqual(
-                    list(mesh.iter_elements()),
-                    # pylint: disable=protected-access
-                    mesh._cache_elements,  # type: ignore
-                    'unexpected element list')
-            with self.subTest('subset'):
-                self.assertListEqual(
-                    list(mesh.iter_elements(2, 3)),
-                    [py2dm.Element3T(2, 2, 3, 4),
-                     py2dm.Element2L(3, 1, 3)],
-                    'unexpected element list')
-            with self.subTest('subset (lower unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_elements(-1, 2)),
-                    [py2dm.Element3T(1, 1, 2, 3),
-                     py2dm.Element3T(2, 2, 3, 4)],
-                    'unexpected element list')
-            with self.subTest('subset (upper unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_elements(3, -1)),
-                    [py2dm.Element2L(3, 1, 3),
-                     py2dm.Element2L(4, 2, 4)],
-                    'unexpected element list')
-            with self.subTest('start < min'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_elements(0)
-            with self.subTest('start > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_elements(mesh.num_elements+1)
-            with self.subTest('end < start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_elements(4, 3)
-            with self.subTest('end == start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_elements(3, 3)
-            with self.subTest('end > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_elements(1, mesh.num_elements+1)
+        mesh = self._mesh
+        with self.subTest('full'):
+            self.assertListEqual(
+                list(mesh.iter_elements()),
+                # pylint: disable=protected-access
+                mesh._cache_elements,  # type: ignore
+                'unexpected element list')
+        with self.subTest('subset'):
+            self.assertListEqual(
+                list(mesh.iter_elements(2, 3)),
+                [py2dm.Element3T(2, 2, 3, 4),
+                 py2dm.Element2L(3, 1, 3)],
+                'unexpected element list')
+        with self.subTest('subset (lower unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_elements(-1, 2)),
+                [py2dm.Element3T(1, 1, 2, 3),
+                 py2dm.Element3T(2, 2, 3, 4)],
+                'unexpected element list')
+        with self.subTest('subset (upper unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_elements(3, -1)),
+                [py2dm.Element2L(3, 1, 3),
+                 py2dm.Element2L(4, 2, 4)],
+                'unexpected element list')
+        with self.subTest('start < min'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_elements(0)
+        with self.subTest('start > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_elements(mesh.num_elements+1)
+        with self.subTest('end < start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_elements(4, 3)
+        with self.subTest('end == start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_elements(3, 3)
+        with self.subTest('end > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_elements(1, mesh.num_elements+1)
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
 
     def test_iter_nodes(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('full'):
-                self.assertListEqual(
-                    list(mesh.iter_nodes()),
-                    # pylint: disable=protected-access
-                    mesh._cache_nodes,  # type: ignore
-                    'unexpected node list')
-            with self.subTest('subset'):
-                self.assertListEqual(
-                    list(mesh.iter_nodes(2, 4)),
-                    [py2dm.Node(2, -5.0, 5.0, 2.0),
-                     py2dm.Node(3, 5.0, -5.0, -3.0),
-                     py2dm.Node(4, 5.0, 5.0, 4.0)],
-                    'unexpected node list')
-            with self.subTest('subset (lower unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_nodes(-1, 2)),
-                    [py2dm.Node(1, -5.0, -5.0, -1.0),
-                     py2dm.Node(2, -5.0, 5.0, 2.0)],
-                    'unexpected node list')
-            with self.subTest('subset (upper unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_nodes(3, -1)),
-                    [py2dm.Node(3, 5.0, -5.0, -3.0),
-                     py2dm.Node(4, 5.0, 5.0, 4.0),
-                     py2dm.Node(5, 0.0, 0.0, 5.0)],
-                    'unexpected node list')
-            with self.subTest('start < min'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_nodes(0)
-            with self.subTest('start > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_nodes(mesh.num_nodes+1)
-            with self.subTest('end < start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_nodes(4, 3)
-            with self.subTest('end == start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_nodes(3, 3)
-            with self.subTest('end > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_nodes(1, mesh.num_nodes+1)
+        mesh = self._mesh
+        with self.subTest('full'):
+            self.assertListEqual(
+                list(mesh.iter_nodes()),
+                list(mesh.nodes),
+                'unexpected node list')
+        with self.subTest('subset'):
+            self.assertListEqual(
+                list(mesh.iter_nodes(2, 4)),
+                [py2dm.Node(2, -5.0, 5.0, 2.0),
+                 py2dm.Node(3, 5.0, -5.0, -3.0),
+                 py2dm.Node(4, 5.0, 5.0, 4.0)],
+                'unexpected node list')
+        with self.subTest('subset (lower unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_nodes(-1, 2)),
+                [py2dm.Node(1, -5.0, -5.0, -1.0),
+                 py2dm.Node(2, -5.0, 5.0, 2.0)],
+                'unexpected node list')
+        with self.subTest('subset (upper unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_nodes(3, -1)),
+                [py2dm.Node(3, 5.0, -5.0, -3.0),
+                 py2dm.Node(4, 5.0, 5.0, 4.0),
+                 py2dm.Node(5, 0.0, 0.0, 5.0)],
+                'unexpected node list')
+        with self.subTest('start < min'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_nodes(0)
+        with self.subTest('start > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_nodes(mesh.num_nodes+1)
+        with self.subTest('end < start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_nodes(4, 3)
+        with self.subTest('end == start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_nodes(3, 3)
+        with self.subTest('end > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_nodes(1, mesh.num_nodes+1)
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
                 _ = reader.extent
 
     def test_iter_node_strings(self) -> None:
-        with py2dm.Reader(self._PATH) as mesh:
-            with self.subTest('full'):
-                self.assertListEqual(
-                    list(mesh.iter_node_strings()),
-                    # pylint: disable=protected-access
-                    mesh._cache_node_strings,  # type: ignore
-                    'unexpected node string list')
-            with self.subTest('subset'):
-                self.assertListEqual(
-                    list(mesh.iter_node_strings(0, 2)),
-                    [py2dm.NodeString(1, 2, 4, 3, name='first'),
-                     py2dm.NodeString(4, 5, 1, name='second')],
-                    'unexpected node string list')
-            with self.subTest('subset (lower unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_node_strings(-1, 1)),
-                    [py2dm.NodeString(1, 2, 4, 3, name='first')],
-                    'unexpected node string list')
-            with self.subTest('subset (upper unbounded)'):
-                self.assertListEqual(
-                    list(mesh.iter_node_strings(1, -1)),
-                    [py2dm.NodeString(4, 5, 1, name='second')],
-                    'unexpected node string list')
-            with self.subTest('start > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_node_strings(mesh.num_node_strings)
-            with self.subTest('end < start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_node_strings(1, 0)
-            with self.subTest('end == start'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_node_strings(1, 1)
-            with self.subTest('end > max'):
-                with self.assertRaises(IndexError):
-                    _ = mesh.iter_node_strings(0, mesh.num_node_strings+1)
+        mesh = self._mesh
+        with self.subTest('full'):
+            self.assertListEqual(
+                list(mesh.iter_node_strings()),
+                # pylint: disable=protected-access
+                mesh._cache_node_strings,  # type: ignore
+                'unexpected node string list')
+        with self.subTest('subset'):
+            self.assertListEqual(
+                list(mesh.iter_node_strings(0, 2)),
+                [py2dm.NodeString(1, 2, 4, 3, name='first'),
+                 py2dm.NodeString(4, 5, 1, name='second')],
+                'unexpected node string list')
+        with self.subTest('subset (lower unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_node_strings(-1, 1)),
+                [py2dm.NodeString(1, 2, 4, 3, name='first')],
+                'unexpected node string list')
+        with self.subTest('subset (upper unbounded)'):
+            self.assertListEqual(
+                list(mesh.iter_node_strings(1, -1)),
+                [py2dm.NodeString(4, 5, 1, name='second')],
+                'unexpected node string list')
+        with self.subTest('start > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_node_strings(mesh.num_node_strings)
+        with self.subTest('end < start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_node_strings(1, 0)
+        with self.subTest('end == start'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_node_strings(1, 1)
+        with self.subTest('end > max'):
+            with self.assertRaises(IndexError):
+                _ = mesh.iter_node_strings(0, mesh.num_node_strings+1)
         with self.subTest('closed'):
             reader = py2dm.Reader(self._PATH)
             with self.assertRaises(py2dm.errors.FileIsClosedError):
@@ -364,7 +381,7 @@ class TestReader(unittest.TestCase):
 class TestReadSynthetic(unittest.TestCase):
     """Short, synthetic files to check specific parsing behaviours."""
 
-    _DATA_DIR = os.path.join('tests', 'data')
+    _DATA_DIR = _TEST_DATA
 
     @classmethod
     def data(cls, filename: str) -> str:
@@ -378,15 +395,15 @@ class TestReadSynthetic(unittest.TestCase):
             self.assertTrue(
                 all((math.isnan(f) for f in mesh.extent)),
                 'mesh extents are not empty')
-            self.assertListEqual(
-                list(mesh.elements), [],
-                'elements list is not empty')
-            self.assertListEqual(
-                list(mesh.nodes), [],
-                'nodes list ist not empty')
-            self.assertListEqual(
-                list(mesh.node_strings), [],
-                'node strings list is not empty')
+            self.assertIsNone(
+                next(mesh.elements, None),
+                'elements iterator is not empty')
+            self.assertIsNone(
+                next(mesh.nodes, None),
+                'nodes iterator is not empty')
+            self.assertIsNone(
+                next(mesh.node_strings, None),
+                'node strings iterator is not empty')
             self.assertEqual(
                 mesh.num_elements, 0,
                 'element count is not zero')
@@ -458,6 +475,16 @@ class TestReadSynthetic(unittest.TestCase):
             with self.assertRaises(StopIteration):
                 _ = next(iter(mesh.iter_node_strings()))
 
+    def test_byte_order_mark(self) -> None:
+        path = self.data('byte-order-mark.2dm')
+        with py2dm.Reader(self.data('nodes-only.2dm')) as mesh:
+            nodes = list(mesh.nodes)
+        for buffered in (False, True):
+            with self.subTest(buffered=buffered):
+                with py2dm.Reader(path, buffered=buffered) as mesh:
+                    self.assertEqual(mesh.num_nodes, 4)
+                    self.assertListEqual(list(mesh.nodes), nodes)
+
     def test_nodes_only(self) -> None:
         path = self.data('nodes-only.2dm')
         with py2dm.Reader(path) as mesh:
@@ -532,6 +559,10 @@ class TestReadSynthetic(unittest.TestCase):
                 'bad node iterator')
             with self.assertRaises(StopIteration):
                 _ = next(iter(mesh.iter_node_strings()))
+        with self.subTest('not zero-indexed'):
+            with self.assertRaisesRegex(
+                    py2dm.errors.FormatError, r'(?i)zero.?index'):
+                py2dm.Reader(path).open()
 
     def test_basic_node_strings(self) -> None:
         path = self.data('basic-node-strings.2dm')
@@ -593,6 +624,92 @@ class TestReadSynthetic(unittest.TestCase):
                 py2dm.NodeString(4, 5, 1, name='second'),
                 'bad node string')
 
+    def test_duplicate_node_string_names(self) -> None:
+        path = self.data('duplicate-node-strings.2dm')
+        with py2dm.Reader(path) as mesh:
+            self.assertEqual(
+                mesh.num_node_strings, 2,
+                'incorrect node string count')
+            self.assertEqual(
+                mesh.node_string('boundary'),
+                py2dm.NodeString(1, 2, 4, name='boundary'),
+                'first node string of a given name not returned')
+
+    def test_buffered(self) -> None:
+        for filename in ('all-the-comments.2dm', 'basic-node-strings.2dm',
+                         'empty-mesh.2dm', 'nodes-only.2dm'):
+            path = self.data(filename)
+            with self.subTest(filename):
+                with py2dm.Reader(path, buffered=False) as mesh:
+                    nodes = list(mesh.nodes)
+                    elements = list(mesh.elements)
+                    node_strings = list(mesh.node_strings)
+                with py2dm.Reader(path, buffered=True) as mesh:
+                    self.assertListEqual(list(mesh.nodes), nodes)
+                    self.assertListEqual(list(mesh.elements), elements)
+                    self.assertListEqual(
+                        list(mesh.node_strings), node_strings)
+        with self.subTest('zero-indexed'):
+            path = self.data('zero-indexed.2dm')
+            with py2dm.Reader(path, zero_index=True, buffered=False) as mesh:
+                nodes = list(mesh.nodes)
+            with py2dm.Reader(path, zero_index=True, buffered=True) as mesh:
+                self.assertListEqual(list(mesh.nodes), nodes)
+
+    def test_single_precision(self) -> None:
+        path = self.data('inexact-coordinates.2dm')
+        single = struct.unpack('f', struct.pack('f', 0.1))[0]
+        with self.subTest('default'):
+            with py2dm.Reader(path) as mesh:
+                self.assertTupleEqual(mesh.node(1).pos, (0.1, -0.1, 0.1))
+                self.assertTupleEqual(mesh.extent, (0.1, 1.0, -0.1, 2.0))
+        with self.subTest('single precision'):
+            with py2dm.Reader(path, single_precision=True) as mesh:
+                node = mesh.node(1)
+                self.assertNotEqual(node.x, 0.1)
+                self.assertTupleEqual(node.pos, (single, -single, single))
+                self.assertTupleEqual(
+                    mesh.extent, (single, 1.0, -single, 2.0))
+                self.assertEqual(mesh.node(2), py2dm.Node(2, 1.0, 2.0, 3.0))
+
+    def test_lazy(self) -> None:
+        for filename in ('all-the-comments.2dm', 'basic-node-strings.2dm',
+                         'empty-mesh.2dm', 'nodes-only.2dm'):
+            path = self.data(filename)
+            with self.subTest(filename):
+                with py2dm.Reader(path) as mesh:
+                    elements = list(mesh.elements)
+                with py2dm.Reader(path, lazy=True) as mesh:
+                    self.assertListEqual(list(mesh.elements), elements)
+                    if elements:
+                        self.assertIs(mesh.element(1), mesh.element(1))
+                        self.assertListEqual(
+                            list(mesh.iter_elements()), elements)
+        with self.subTest('zero-indexed'):
+            path = self.data('zero-indexed.2dm')
+            with py2dm.Reader(path, zero_index=True) as mesh:
+                elements = list(mesh.elements)
+            with py2dm.Reader(path, zero_index=True, lazy=True) as mesh:
+                self.assertEqual(mesh.element(0), elements[0])
+                self.assertListEqual(list(mesh.elements), elements)
+        with self.subTest('malformed element'):
+            path = self.data('malformed-element.2dm')
+            with py2dm.Reader(path) as mesh:
+                self.assertListEqual(
+                    list(mesh.elements),
+                    [py2dm.Element3T(1, 1, 2, 3),
+                     py2dm.Element3T(3, 2, 3, 4)],
+                    'malformed element not skipped')
+            with py2dm.Reader(path, lazy=True) as mesh:
+                self.assertEqual(
+                    mesh.element(1), py2dm.Element3T(1, 1, 2, 3),
+                    'bad element before malformed line')
+                self.assertEqual(
+                    mesh.element(3), py2dm.Element3T(3, 2, 3, 4),
+                    'bad element after malformed line')
+                with self.assertRaises(ValueError):
+                    _ = mesh.element(2)
+
 
 class TestReadMdal(unittest.TestCase):
     """Extra test cases from the MDAL repository.
@@ -602,7 +719,7 @@ class TestReadMdal(unittest.TestCase):
     MDAL for its mesh data support).
     """
 
-    _DATA_DIR = os.path.join('tests', 'data', 'external', 'mdal')
+    _DATA_DIR = os.path.join(_TEST_DATA, 'external', 'mdal')
 
     @classmethod
     def data(cls, filename: str) -> str:
@@ -660,6 +777,18 @@ class TestReadMdal(unittest.TestCase):
                         17710, 18051, 18050, 17947, 17948, materials=(1,)),
                     'bad element')
 
+    def test_quad_georefed_warnings(self) -> None:
+        path = self.data('M01_5m_002.2dm')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            with py2dm.Reader(path, materials=1):
+                pass
+        self.assertListEqual(
+            [(w.category, str(w.message)) for w in caught],
+            [(py2dm.errors.CustomFormatIgnored,
+              'unexpected node fields (20893 nodes)')],
+            'extra node fields not reported in a single warning')
+
     def test_numbering_gaps(self) -> None:
         path = self.data('mesh_with_numbering_gaps.2dm')
         with self.assertRaises(py2dm.errors.FormatError):
@@ -807,7 +936,7 @@ class TestReadMdal(unittest.TestCase):
 class TestReadExternal(unittest.TestCase):
     """Additional real-world files for testing."""
 
-    _DATA_DIR = os.path.join('tests', 'data', 'external')
+    _DATA_DIR = os.path.join(_TEST_DATA, 'external')
 
     @classmethod
     def data(cls, filename: str, *args: str) -> str:
@@ -12,6 +12,8 @@ import py2dm  # pylint: disable=import-error
 from py2dm.utils import (convert_random_nodes, convert_unsorted_nodes,
                          merge_meshes)
 
+_TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
 
 # pylint: disable=missing-function-docstring
 
@@ -19,7 +21,7 @@ from py2dm.utils import (convert_random_nodes, convert_unsorted_nodes,
 class TestTriangleConverter(unittest.TestCase):
     """Tests for the py2dm.utils.triangle_to_2dm method."""
 
-    _PATH = os.path.join('tests', 'data', 'triangle')
+    _PATH = os.path.join(_TEST_DATA, 'triangle')
 
     def get_triangle_output(self, filename: str) -> Tuple[str, str]:
         """Return the pregenerated output for a given test file."""
@@ -88,7 +90,7 @@ class TestTriangleConverter(unittest.TestCase):
 class UnsortedIdConverter(unittest.TestCase):
     """Test cases for the `convert_unsorted_nodes` parser."""
 
-    _DATA_DIR = os.path.join('tests', 'data', 'external', 'mdal')
+    _DATA_DIR = os.path.join(_TEST_DATA, 'external', 'mdal')
 
     _temp_dir: tempfile.TemporaryDirectory  # type: ignore
 
@@ -131,7 +133,7 @@ class UnsortedIdConverter(unittest.TestCase):
 class RandomIdConverter(unittest.TestCase):
     """Test cases for the `convert_random_nodes` parser."""
 
-    _DATA_DIR = os.path.join('tests', 'data', 'external', 'mdal')
+    _DATA_DIR = os.path.join(_TEST_DATA, 'external', 'mdal')
 
     _temp_dir: tempfile.TemporaryDirectory  # type: ignore
 
@@ -181,7 +183,7 @@ class RandomIdConverter(unittest.TestCase):
             self.assertEqual(mesh.element(2).card, 'E3T')
 
     def test_basic_unsorted_ns(self) -> None:
-        path = self.convert('basic-unsorted-ns.2dm', True, 'tests/data/')
+        path = self.convert('basic-unsorted-ns.2dm', True, _TEST_DATA)
         with py2dm.Reader(path) as mesh:
             self.assertEqual(mesh.num_elements, 4)
             self.assertEqual(mesh.num_nodes, 5)
@@ -215,7 +217,7 @@ class RandomIdConverter(unittest.TestCase):
 class MeshMerger(unittest.TestCase):
     """Tests for the py2dm.utils.merge_meshes method."""
 
-    _PATH = os.path.join('tests', 'data')
+    _PATH = _TEST_DATA
 
     _temp_dir: tempfile.TemporaryDirectory  # type: ignore
 
@@ -9,6 +9,8 @@ from typing import Any, Tuple
 
 import py2dm  # pylint: disable=import-error
 
+_TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
 
 # pylint: disable=missing-function-docstring
 
@@ -561,7 +563,7 @@ class TestFileCopy(unittest.TestCase):
                 'differing node strings in copy')
 
     def test_basic_node_string(self) -> None:
-        source = os.path.join('tests', 'data', 'basic-node-strings.2dm')
+        source = os.path.join(_TEST_DATA, 'basic-node-strings.2dm')
         copy = self.copy_file(source)
         with py2dm.Reader(source) as mesh_a:
             with py2dm.Reader(copy) as mesh_b: